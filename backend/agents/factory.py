@@ -6,11 +6,13 @@ in the handoffs system.
 """
 
 import asyncio
+from typing import Awaitable, Callable, Optional
 
 from autogen_core import SingleThreadedAgentRuntime, TypeSubscription
 from autogen_core.models import ChatCompletionClient
 
 from base.AIAgent import AIAgent
+from config.logging_config import get_logger
 from .websocket_agent import WebSocketAgent
 from .triage_agent import TriageAgent
 from .planning_agent import PlanningAgent
@@ -54,7 +56,29 @@ class AgentFactory:
         self.model_client = model_client
         self.registered_agents = {}
         self.input_queue = asyncio.Queue()
-        self.response_queue = asyncio.Queue()
+        self._response_sink: Optional[Callable[[str], Awaitable[None]]] = None
+
+    def register_sink(self, sink: Optional[Callable[[str], Awaitable[None]]]):
+        """
+        Register the coroutine function that delivers agent replies to the user.
+
+        Args:
+            sink: Called with each serialized reply; None detaches the current sink
+        """
+        self._response_sink = sink
+
+    async def _send_response(self, text: str):
+        """Push a serialized agent reply straight to the registered sink."""
+        logger = get_logger(__name__)
+        if self._response_sink is None:
+            logger.warning("No client connected, dropping agent reply: %s", text)
+            return
+        try:
+            await self._response_sink(text)
+        except Exception:
+            # Raised inside the runtime's message handler otherwise, e.g. when
+            # the socket closed while the reply was being produced
+            logger.warning("Failed to deliver agent reply: %s", text, exc_info=True)
     
     async def register_all_agents(self):
         """
@@ -186,7 +210,7 @@ class AgentFactory:
             type=USER_TOPIC_TYPE,
             factory=lambda: WebSocketAgent(
                 input_queue=self.input_queue,
-                response_queue=self.response_queue,
+                send_response=self._send_response,
                 user_topic_type=USER_TOPIC_TYPE,
                 agent_topic_type=TRIAGE_AGENT_TOPIC_TYPE,
             )
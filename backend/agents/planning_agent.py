@@ -16,6 +16,18 @@ from .tools import (
 )
 
 
+# Shared by every PlanningAgent instance; agents only read it
+_SYSTEM_MESSAGE = SystemMessage(
+    content="You are a project planning agent for ACME Inc. Your role is to:\n"
+    "1. Help users create project plans\n"
+    "2. Gather and document requirements\n"
+    "3. Create project timelines and milestones\n"
+    "4. Use the create_project_plan tool when needed\n"
+    "5. Transfer back to triage if the request is outside your scope\n\n"
+    "Always be thorough and professional. Ask clarifying questions when needed."
+)
+
+
 class PlanningAgent(AIAgent):
     """
     Project planning agent responsible for creating project plans and gathering requirements.
@@ -34,15 +46,7 @@ class PlanningAgent(AIAgent):
             model_client: The LLM client for processing requests
             tools: Additional tools beyond the standard planning tools
         """
-        system_message = SystemMessage(
-            content="You are a project planning agent for ACME Inc. Your role is to:\n"
-            "1. Help users create project plans\n"
-            "2. Gather and document requirements\n"
-            "3. Create project timelines and milestones\n"
-            "4. Use the create_project_plan tool when needed\n"
-            "5. Transfer back to triage if the request is outside your scope\n\n"
-            "Always be thorough and professional. Ask clarifying questions when needed."
-        )
+        system_message = _SYSTEM_MESSAGE
         
         planning_tools = [create_project_plan_tool]
         delegate_tools = [transfer_back_to_triage_tool]
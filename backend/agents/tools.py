@@ -11,6 +11,8 @@ import re
 import uuid
 from datetime import datetime, date
 
+import orjson
+
 from config.logging_config import get_logger
 from autogen_core.tools import FunctionTool
 from models.data_models import Project
@@ -160,11 +162,11 @@ async def retrieve_project_data(name: str) -> str:
             raise FileNotFoundError("No project data files found in output_documents.")
         # For simplicity, retrieve the first file (could be improved to select by project name)
         project_file = os.path.join(output_dir, safe_project_name + ".json")
-        with open(project_file, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+        with open(project_file, 'rb') as f:
+            project_data = orjson.loads(f.read())
         
         # Return the JSON data as a string to avoid UUID serialization issues
-        return json.dumps(project_data, indent=2, cls=UUIDEncoder)
+        return orjson.dumps(project_data, option=orjson.OPT_INDENT_2).decode()
     except Exception as e:
         logger.error(f"Error retrieving project data: {e}")
         # Return an error message if retrieval fails
@@ -1,5 +1,6 @@
 
 import asyncio
+from typing import Awaitable, Callable
 from autogen_core import MessageContext, RoutedAgent, TopicId, message_handler
 from autogen_core.models import UserMessage
 from base.messaging import UserLogin, UserTask, AgentResponse
@@ -7,10 +8,10 @@ from .tools import USER_TOPIC_TYPE, TRIAGE_AGENT_TOPIC_TYPE
 from config.logging_config import get_logger
 
 class WebSocketAgent(RoutedAgent):
-    def __init__(self, input_queue: asyncio.Queue, response_queue: asyncio.Queue, user_topic_type: str, agent_topic_type: str):
+    def __init__(self, input_queue: asyncio.Queue, send_response: Callable[[str], Awaitable[None]], user_topic_type: str, agent_topic_type: str):
         super().__init__("A websocket agent for managing user sessions.")
         self._input_queue = input_queue
-        self._response_queue = response_queue
+        self._send_response = send_response
         self._user_topic_type = user_topic_type
         self._agent_topic_type = agent_topic_type
 
@@ -32,9 +33,12 @@ class WebSocketAgent(RoutedAgent):
     @message_handler
     async def handle_task_result(self, message: AgentResponse, ctx: MessageContext) -> None:
         logger = get_logger(__name__)
-        logger.info(f"Handling task result from {message.reply_to_topic_type}: {message.context}")
+        logger.info("Handling task result from %s: %s", message.reply_to_topic_type, message.context)
         
-        await self._response_queue.put(message)
+        if message.context:
+            agent_reply = message.context[-1].model_dump_json()
+            logger.info("Sending agent reply to client: %s", agent_reply)
+            await self._send_response(agent_reply)
 
         user_input = await self._input_queue.get()
 
@@ -43,7 +47,7 @@ class WebSocketAgent(RoutedAgent):
         #    return
             
         message.context.append(UserMessage(content=user_input, source="User"))
-        logger.info(f"Publishing user input to {message.reply_to_topic_type}: {user_input}")
+        logger.info("Publishing user input to %s: %s", message.reply_to_topic_type, user_input)
 
         await self.publish_message(
             UserTask(context=message.context), 
@@ -6,6 +6,7 @@ This module contains common utility functions used across the handoffs system.
 
 from pathlib import Path
 
+from grpc import Compression
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.openai import OpenAIInstrumentor
@@ -58,16 +59,17 @@ def configure_oltp_tracing(endpoint: str = "http://localhost:4317") -> trace.Tra
     Returns:
         Configured TracerProvider instance
     """
-    otel_exporter = OTLPSpanExporter(endpoint=endpoint, insecure=True)
-    span_processor = BatchSpanProcessor(otel_exporter)
+    # Spans carry prompts and replies as attributes, which compress well
+    otel_exporter = OTLPSpanExporter(endpoint=endpoint, insecure=True, compression=Compression.Gzip)
     
     # Configure Tracing
     tracer_provider = TracerProvider(resource=Resource({"service.name": "autogen-handoffs"}))
-    processor = BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, insecure=True))
-    tracer_provider.add_span_processor(processor)
+    tracer_provider.add_span_processor(BatchSpanProcessor(otel_exporter))
     trace.set_tracer_provider(tracer_provider)
     
-    # Instrument the OpenAI Python library
-    OpenAIInstrumentor().instrument()   
+    # Instrument the OpenAI Python library, once per process
+    instrumentor = OpenAIInstrumentor()
+    if not instrumentor.is_instrumented_by_opentelemetry:
+        instrumentor.instrument()
 
     return tracer_provider
\ No newline at end of file
@@ -6,15 +6,35 @@ This module provides centralized logging configuration with:
 - Console logging for development
 - Log rotation and formatting
 - Different log levels for different components
+- File and console output written from a background thread
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from typing import Optional
 
 
+# Writes queued records to the file and console handlers off the event loop
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush the queued records, stop the background writer and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -43,10 +63,11 @@ def setup_logging(
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
-    # Clear any existing handlers
+    # Clear any existing handlers and stop the previous background writer
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -71,14 +92,24 @@ def setup_logging(
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # Console handler (optional)
     if console_logging:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(simple_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # The root logger only enqueues records; QueueHandler.prepare() merges the
+    # message arguments and exception text on the calling thread, and a
+    # listener thread formats and writes them, so logging calls never block
+    # on disk or console I/O
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Set specific logger levels
     logging.getLogger("autogen").setLevel(logging.WARNING)
@@ -104,6 +104,7 @@ class RuntimeConfig:
     """Configuration for runtime behavior"""
     max_concurrent_agents: int = 10
     session_timeout: int = 3600  # seconds
+    session_pool_size: int = 2  # sessions kept initialized ahead of /api/session
     enable_tracing: bool = True
     tracing_endpoint: str = "http://localhost:4317"
 
@@ -131,6 +132,7 @@ class ServerConfig:
     """Configuration for the web server"""
     host: str = "0.0.0.0"
     port: int = 8000
+    access_log: bool = False  # the app logs sessions and connections itself
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -279,15 +281,20 @@ class ConfigManager:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
-_config_manager_instance: Optional[ConfigManager] = None
+_config_managers: Dict[Path, ConfigManager] = {}
 
 def get_config_manager(config_file: str = "../config/config.json") -> ConfigManager:
-    """Get a configured ConfigManager instance."""
-    global _config_manager_instance
-    if _config_manager_instance is None or _config_manager_instance.config_file != Path(config_file):
-        _config_manager_instance = ConfigManager(config_file)
-    
-    return _config_manager_instance
+    """
+    Get a configured ConfigManager instance.
+
+    The file is parsed once per resolved path; later calls return the same
+    instance, which callers should treat as read-only.
+    """
+    key = Path(config_file).resolve()
+    config_manager = _config_managers.get(key)
+    if config_manager is None:
+        config_manager = _config_managers[key] = ConfigManager(config_file)
+    return config_manager
 
 
 def create_default_config(config_file: str = "../config/config.json"):
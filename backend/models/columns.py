@@ -0,0 +1,292 @@
+"""
+Columnar views over collections of data model records.
+
+Reports that aggregate over many ``Requirement``, ``Issue`` or ``BacklogItem``
+rows (status counts, priority histograms) walk one Pydantic instance per row.
+This module converts such a list once into a structure-of-arrays layout where
+every enum-typed field is stored as a compact ``int8`` code column and every
+float field (velocities, capacities, hours) as a ``double`` column, so that
+aggregations run as C-level passes over contiguous arrays instead of Python
+attribute lookups per row. String-set fields such as ``BacklogItem.tags`` can
+be packed on demand into one bitmask per row for "tagged X and Y" filters.
+
+The rest of the code stays row-oriented: use ``to_columns`` to build the view
+for a report and ``from_columns`` to lift a single row back into its model.
+"""
+
+import math
+from array import array
+from enum import Enum
+from typing import (Annotated, Any, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, Type, Union,
+                    get_args, get_origin)
+
+from .data_models import ConfiguredBaseModel
+
+MISSING_CODE = -1
+
+
+def _enum_values(annotation: Any) -> Optional[Tuple[str, ...]]:
+    """Return the allowed values of a (possibly Optional or Annotated) Enum or Literal field."""
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return tuple(member.value for member in annotation)
+    if get_origin(annotation) is Annotated:
+        return _enum_values(get_args(annotation)[0])
+    if get_origin(annotation) is Literal:
+        return get_args(annotation)
+    if get_origin(annotation) is Union:
+        for arg in get_args(annotation):
+            values = _enum_values(arg)
+            if values is not None:
+                return values
+    return None
+
+
+def _is_float(annotation: Any) -> bool:
+    """Return True for ``float`` and ``Optional[float]`` field annotations."""
+    if annotation is float:
+        return True
+    return get_origin(annotation) is Union and float in get_args(annotation)
+
+
+class EnumColumn:
+    """
+    Enum-valued field stored as one ``int8`` code per row.
+
+    Codes index into ``values`` (the allowed values in declaration order);
+    ``MISSING_CODE`` marks rows where the field is unset.
+    """
+
+    def __init__(self, values: Sequence[str], raw_values: Sequence[Any]):
+        self.values = tuple(values)
+        lookup = {value: code for code, value in enumerate(self.values)}
+        self.codes = array('b', (
+            lookup.get(value.value if isinstance(value, Enum) else value, MISSING_CODE)
+            for value in raw_values
+        ))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self, index: int) -> Optional[str]:
+        """Return the enum value stored at ``index`` or None if unset."""
+        code = self.codes[index]
+        return None if code == MISSING_CODE else self.values[code]
+
+    def histogram(self) -> List[int]:
+        """Count rows per code, in the order of ``values``."""
+        return [self.codes.count(code) for code in range(len(self.values))]
+
+    def counts(self) -> Dict[str, int]:
+        """Count rows per enum value, e.g. ``{'High': 3, 'Low': 1, ...}``."""
+        return dict(zip(self.values, self.histogram()))
+
+    def weighted_sum(self, weights: Mapping[str, float]) -> float:
+        """
+        Sum a per-value weight over all rows, e.g. a priority-weighted score.
+
+        Args:
+            weights: Weight per enum value; values without a weight count as 0
+
+        Returns:
+            float: The sum of the weights of every row's value
+        """
+        return sum(
+            weights.get(value, 0) * count
+            for value, count in zip(self.values, self.histogram())
+        )
+
+
+class NumericColumn:
+    """
+    Float-valued field stored as one ``double`` per row.
+
+    Unset rows hold NaN and are skipped by the aggregations.
+    """
+
+    def __init__(self, raw_values: Sequence[Optional[float]]):
+        self.values = array('d', (math.nan if value is None else value for value in raw_values))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def decode(self, index: int) -> Optional[float]:
+        """Return the value stored at ``index`` or None if unset."""
+        value = self.values[index]
+        return None if math.isnan(value) else value
+
+    def present(self) -> List[float]:
+        """Return the set values, in row order."""
+        return [value for value in self.values if not math.isnan(value)]
+
+    def count(self) -> int:
+        """Count the rows where the field is set."""
+        return len(self.present())
+
+    def sum(self) -> float:
+        """Sum the set values."""
+        return math.fsum(self.present())
+
+    def mean(self) -> Optional[float]:
+        """Average the set values, or None if no row has one."""
+        present = self.present()
+        return math.fsum(present) / len(present) if present else None
+
+
+class TagColumn:
+    """
+    String-set field stored as one bitmask per row.
+
+    Bit positions index into ``vocabulary``, which is built from the rows of
+    this view; with up to 64 distinct values the masks are kept as ``uint64``.
+    """
+
+    def __init__(self, raw_values: Sequence[Optional[Sequence[str]]]):
+        self.vocabulary: Dict[str, int] = {}
+        masks = []
+        for tags in raw_values:
+            mask = 0
+            for tag in tags or ():
+                mask |= 1 << self.vocabulary.setdefault(tag, len(self.vocabulary))
+            masks.append(mask)
+        self.masks = array('Q', masks) if len(self.vocabulary) <= 64 else masks
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def mask_of(self, tags: Iterable[str]) -> Optional[int]:
+        """Return the bitmask of ``tags``, or None if a tag is not in the vocabulary."""
+        mask = 0
+        for tag in tags:
+            if tag not in self.vocabulary:
+                return None
+            mask |= 1 << self.vocabulary[tag]
+        return mask
+
+    def matching(self, *tags: str) -> List[int]:
+        """Return the indexes of the rows carrying all of ``tags``."""
+        want = self.mask_of(tags)
+        if want is None:
+            return []
+        return [index for index, mask in enumerate(self.masks) if mask & want == want]
+
+    def counts(self) -> Dict[str, int]:
+        """Count rows per tag."""
+        return {
+            tag: sum(1 for mask in self.masks if mask >> bit & 1)
+            for tag, bit in self.vocabulary.items()
+        }
+
+
+class RecordColumns:
+    """
+    Structure-of-arrays representation of a list of records of one model.
+
+    Attributes:
+        model: The model class the rows were built from
+        ids: Row identifiers, in row order
+        enums: Enum-typed fields as ``EnumColumn`` code columns
+        numbers: Float fields as ``NumericColumn`` columns
+        fields: All remaining fields as plain Python lists
+    """
+
+    def __init__(self, model: Type[ConfiguredBaseModel], ids: List[Any],
+                 enums: Dict[str, EnumColumn], numbers: Dict[str, NumericColumn],
+                 fields: Dict[str, List[Any]]):
+        self.model = model
+        self.ids = ids
+        self.enums = enums
+        self.numbers = numbers
+        self.fields = fields
+        self._tags: Dict[str, TagColumn] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def counts(self, field_name: str) -> Dict[str, int]:
+        """Count rows per value of the enum-typed field ``field_name``."""
+        return self.enums[field_name].counts()
+
+    def weighted_sum(self, field_name: str, weights: Mapping[str, float]) -> float:
+        """Sum ``weights`` over the values of the enum-typed field ``field_name``."""
+        return self.enums[field_name].weighted_sum(weights)
+
+    def sum(self, field_name: str) -> float:
+        """Sum the set values of the float field ``field_name``."""
+        return self.numbers[field_name].sum()
+
+    def mean(self, field_name: str) -> Optional[float]:
+        """Average the set values of the float field ``field_name``."""
+        return self.numbers[field_name].mean()
+
+    def tags(self, field_name: str) -> TagColumn:
+        """Return the string-set field ``field_name`` as bitmasks, packing it on first use."""
+        if field_name not in self._tags:
+            self._tags[field_name] = TagColumn(self.fields[field_name])
+        return self._tags[field_name]
+
+    def with_tags(self, field_name: str, *tags: str) -> List[int]:
+        """Return the indexes of the rows whose ``field_name`` holds all of ``tags``."""
+        return self.tags(field_name).matching(*tags)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return the field values of row ``index`` as a dictionary."""
+        data = {name: column[index] for name, column in self.fields.items()}
+        for name, column in self.enums.items():
+            data[name] = column.decode(index)
+        for name, column in self.numbers.items():
+            data[name] = column.decode(index)
+        if 'id' in self.model.model_fields:
+            data['id'] = self.ids[index]
+        return data
+
+
+def to_columns(rows: Sequence[ConfiguredBaseModel],
+               model: Optional[Type[ConfiguredBaseModel]] = None) -> RecordColumns:
+    """
+    Convert a list of records of the same model into a ``RecordColumns`` view.
+
+    Args:
+        rows: Records to convert
+        model: The record model; inferred from the first row when omitted
+
+    Returns:
+        RecordColumns: The columnar view of the records
+    """
+    if model is None:
+        if not rows:
+            raise ValueError("Cannot infer the model of an empty row list")
+        model = type(rows[0])
+
+    enums: Dict[str, EnumColumn] = {}
+    numbers: Dict[str, NumericColumn] = {}
+    fields: Dict[str, List[Any]] = {}
+    for name, info in model.model_fields.items():
+        if name == 'id':
+            continue
+        raw_values = [getattr(row, name) for row in rows]
+        values = _enum_values(info.annotation)
+        if values is not None:
+            enums[name] = EnumColumn(values, raw_values)
+        elif _is_float(info.annotation):
+            numbers[name] = NumericColumn(raw_values)
+        else:
+            fields[name] = raw_values
+
+    ids = [getattr(row, 'id', None) for row in rows]
+    return RecordColumns(model, ids, enums, numbers, fields)
+
+
+def from_columns(columns: RecordColumns, index: int) -> ConfiguredBaseModel:
+    """
+    Lift row ``index`` of a columnar view back into its model instance.
+
+    Args:
+        columns: The columnar view
+        index: Row position
+
+    Returns:
+        ConfiguredBaseModel: An instance of ``columns.model``
+    """
+    # Every value in the view came from a validated record; unset values are
+    # passed too, so fields whose default is not None keep the stored None
+    return columns.model.from_trusted(**columns.row(index))
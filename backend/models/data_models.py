@@ -1,20 +1,20 @@
 from __future__ import annotations 
 
-import re
 import sys
 from datetime import (
     date,
-    datetime,
-    time
+    datetime
 )
-from decimal import Decimal 
 from enum import Enum 
+from functools import cache
 from typing import (
+    Annotated,
     Any,
     ClassVar,
+    Final,
+    Iterable,
     Literal,
-    Optional,
-    Union
+    Optional
 )
 
 from pydantic import (
@@ -22,24 +22,81 @@ from pydantic import (
     ConfigDict,
     Field,
     RootModel,
+    StringConstraints,
+    TypeAdapter,
     field_validator
 )
+from pydantic_core import core_schema
 
 
 metamodel_version = "None"
 version = "None"
 
+# Longer values are left alone so arbitrary free text is never pinned in the intern table
+_INTERN_MAX_LENGTH = 64
+
+
+def _add_linkml_meta(schema: dict[str, Any], model: type) -> None:
+    """Attach each slot's linkml_meta to its property when a JSON schema is generated."""
+    for name, prop in schema.get('properties', {}).items():
+        # Literal fields documented through their enum (_EnumJsonSchema) get a
+        # field title that pydantic leaves out for enum-typed fields
+        if '$ref' in prop or any('$ref' in option for option in prop.get('anyOf', ())):
+            prop.pop('title', None)
+        domain_of = _SLOT_DOMAINS.get(name)
+        if domain_of is not None:
+            prop['linkml_meta'] = {'alias': name, 'domain_of': list(domain_of), **_SLOT_META_EXTRAS.get(name, {})}
+
+
+class _LinkMLMetaDescriptor:
+    """Resolve ``Model.linkml_meta`` lazily through linkml_meta_for()."""
+
+    def __get__(self, instance: Any, owner: type) -> LinkMLMeta:
+        return linkml_meta_for(owner)
+
 
 class ConfiguredBaseModel(BaseModel):
     model_config = ConfigDict(
-        validate_assignment = True,
+        validate_assignment = False,
         validate_default = True,
         extra = "forbid",
-        arbitrary_types_allowed = True,
+        arbitrary_types_allowed = False,
         use_enum_values = True,
         strict = False,
+        frozen = True,
+        revalidate_instances = "never",
+        defer_build = True,
+        json_schema_extra = _add_linkml_meta,
     )
-    pass
+    __slots__ = ()
+    linkml_meta: ClassVar[LinkMLMeta] = _LinkMLMetaDescriptor()
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> ConfiguredBaseModel:
+        """
+        Build an instance from already-validated field values without validating them.
+
+        Use only for values taken from validated records, e.g. a columnar view or
+        bulk_validate_json() output. Untrusted input (request bodies, LLM output)
+        must go through model_validate().
+
+        Args:
+            **data: Field values; missing fields get their defaults
+
+        Returns:
+            ConfiguredBaseModel: The new instance
+        """
+        return cls.model_construct(**data)
+
+    @field_validator('status', 'priority', 'type', 'category', 'assignee', 'owner',
+                     'detected_version', 'resolved_version', 'target_release',
+                     mode='after', check_fields=False)
+    @classmethod
+    def intern_vocabulary(cls, value: Any) -> Any:
+        """Share one string object per distinct value of small-vocabulary fields."""
+        if isinstance(value, str) and len(value) <= _INTERN_MAX_LENGTH:
+            return sys.intern(value)
+        return value
 
 
 
@@ -393,1915 +450,888 @@ class StoryPointsEnum(str, Enum):
     number_21 = "21"
 
 
+class _EnumJsonSchema:
+    """
+    Annotation giving a ``Literal`` field the JSON schema of its source enum.
+
+    The field still validates as a ``Literal``; only the generated schema is
+    taken from the enum, so it keeps the shared ``$defs`` entry with the enum
+    title and description instead of an anonymous inline ``enum`` list.
+    """
+
+    def __init__(self, enum: type[Enum]):
+        self.enum = enum
+
+    def __get_pydantic_json_schema__(self, schema: Any, handler: Any) -> Any:
+        enum_schema = TypeAdapter(self.enum).core_schema
+        return handler(core_schema.definitions_schema(
+            core_schema.definition_reference_schema(enum_schema['ref']), [enum_schema]
+        ))
+
+
+def _literal_of(enum: type[Enum]) -> Any:
+    """Build a ``Literal`` of the interned values of ``enum``, documented as ``enum``."""
+    return Annotated[Literal[tuple(sys.intern(member.value) for member in enum)], _EnumJsonSchema(enum)]
+
+
+# Literal counterparts of the enums on the hottest fields. pydantic-core checks
+# them with a single string lookup and stores the plain str value, which is what
+# use_enum_values keeps for enum-typed fields anyway. The JSON schema still
+# refers to the enum definitions.
+PriorityLiteral = _literal_of(PriorityEnum)
+UserStoryStatusLiteral = _literal_of(UserStoryStatusEnum)
+IssueTypeLiteral = _literal_of(IssueTypeEnum)
+SeverityLiteral = _literal_of(SeverityEnum)
+StoryPointsLiteral = _literal_of(StoryPointsEnum)
+
+
+# Class metadata of every class that adds nothing beyond its source schema
+_SCHEMA_META = {'from_schema': 'https://example.org/software_project_management'}
+
+# Class-level linkml_meta, keyed by class name; see linkml_meta_for()
+_RAW_META = {'Project': {'from_schema': 'https://example.org/software_project_management',
+             'slot_usage': {'methodology': {'name': 'methodology',
+                                            'range': 'MethodologyEnum',
+                                            'required': True},
+                            'sdlc_phase': {'name': 'sdlc_phase',
+                                           'range': 'SDLCPhaseEnum',
+                                           'required': True},
+                            'status': {'name': 'status', 'range': 'ProjectStatusEnum'}}},
+ 'BusinessCase': _SCHEMA_META,
+ 'Scope': _SCHEMA_META,
+ 'Requirement': _SCHEMA_META,
+ 'Epic': {'from_schema': 'https://example.org/software_project_management',
+          'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
+                         'status': {'name': 'status', 'range': 'EpicStatusEnum'}}},
+ 'UserStory': {'from_schema': 'https://example.org/software_project_management',
+               'slot_usage': {'acceptance_criteria': {'maximum_value': 10,
+                                                      'minimum_value': 1,
+                                                      'name': 'acceptance_criteria',
+                                                      'required': True},
+                              'description': {'maximum_value': 1000, 'name': 'description'},
+                              'status': {'name': 'status', 'range': 'UserStoryStatusEnum'}}},
+ 'Backlog': _SCHEMA_META,
+ 'BacklogItem': _SCHEMA_META,
+ 'Sprint': {'from_schema': 'https://example.org/software_project_management',
+            'slot_usage': {'name': {'maximum_value': 50, 'name': 'name'}}},
+ 'Issue': {'from_schema': 'https://example.org/software_project_management',
+           'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
+                          'status': {'name': 'status', 'range': 'IssueStatusEnum'},
+                          'type': {'name': 'type', 'range': 'IssueTypeEnum'}}},
+ 'Team': _SCHEMA_META,
+ 'Risk': {'from_schema': 'https://example.org/software_project_management',
+          'slot_usage': {'description': {'maximum_value': 500,
+                                         'minimum_value': 1,
+                                         'name': 'description',
+                                         'required': True},
+                         'status': {'name': 'status', 'range': 'RiskStatusEnum'}}},
+ 'Milestone': {'from_schema': 'https://example.org/software_project_management',
+               'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
+                              'status': {'name': 'status', 'range': 'MilestoneStatusEnum'}}},
+ 'Deliverable': {'from_schema': 'https://example.org/software_project_management',
+                 'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
+                                'status': {'name': 'status', 'range': 'DeliverableStatusEnum'}}},
+ 'ChangeRequest': {'from_schema': 'https://example.org/software_project_management',
+                   'slot_usage': {'status': {'name': 'status', 'range': 'ApprovalStatusEnum'},
+                                  'type': {'name': 'type', 'range': 'ChangeTypeEnum'}}},
+ 'Baseline': _SCHEMA_META,
+ 'TestCase': {'from_schema': 'https://example.org/software_project_management',
+              'slot_usage': {'type': {'name': 'type', 'range': 'TestTypeEnum'}}},
+ 'Phase': _SCHEMA_META,
+ 'WorkStream': _SCHEMA_META,
+ 'Documentation': {'from_schema': 'https://example.org/software_project_management',
+                   'slot_usage': {'status': {'name': 'status', 'range': 'AgileArtifactStatusEnum'},
+                                  'type': {'name': 'type', 'range': 'DocumentationTypeEnum'}}},
+ 'Repository': {'from_schema': 'https://example.org/software_project_management',
+                'slot_usage': {'type': {'name': 'type', 'range': 'RepositoryTypeEnum'}}},
+ 'Metric': _SCHEMA_META,
+ 'Person': {'class_uri': 'schema:Person',
+            'from_schema': 'https://example.org/software_project_management'},
+ 'TeamMember': {'from_schema': 'https://example.org/software_project_management',
+                'slot_usage': {'role': {'name': 'role', 'range': 'RoleEnum', 'required': True}}},
+ 'Stakeholder': _SCHEMA_META,
+ 'UserProfiler': _SCHEMA_META,
+ 'CommunicationPlan': _SCHEMA_META,
+ 'AIWorkProduct': _SCHEMA_META}
+
+
+# LinkMLMeta instances keyed by the id() of their (module-lifetime) _RAW_META entry,
+# so classes sharing an entry such as _SCHEMA_META share one instance
+_META_INSTANCES: dict[int, LinkMLMeta] = {}
+
+
+@cache
+def linkml_meta_for(cls: type) -> LinkMLMeta:
+    """
+    Return the LinkMLMeta of a model class, building it on first use.
+
+    Args:
+        cls: The model class; subclasses fall back to their nearest described base
+
+    Returns:
+        LinkMLMeta: The class metadata
+    """
+    for klass in cls.__mro__:
+        raw = _RAW_META.get(klass.__name__)
+        if raw is not None:
+            if id(raw) not in _META_INSTANCES:
+                _META_INSTANCES[id(raw)] = LinkMLMeta(raw)
+            return _META_INSTANCES[id(raw)]
+    raise AttributeError(f"No LinkML metadata for {cls.__name__}")
+
+
+# domain_of groups shared by the most widely used slots
+_ID_DOMAIN: Final[tuple[str, ...]] = (
+    'Project', 'BusinessCase', 'Requirement', 'Epic', 'UserStory', 'Backlog', 'BacklogItem', 'Sprint',
+    'Issue', 'Team', 'Risk', 'Milestone', 'Deliverable', 'ChangeRequest', 'Baseline', 'TestCase',
+    'Phase', 'WorkStream', 'Documentation', 'Repository', 'Metric', 'Person', 'CommunicationPlan',
+    'AIWorkProduct',
+)
+_NAME_DOMAIN: Final[tuple[str, ...]] = (
+    'Project', 'Epic', 'Backlog', 'Sprint', 'Team', 'Milestone', 'Deliverable', 'Baseline', 'TestCase',
+    'Phase', 'WorkStream', 'Repository', 'Metric', 'AIWorkProduct',
+)
+_DESCRIPTION_DOMAIN: Final[tuple[str, ...]] = (
+    'Project', 'Requirement', 'Epic', 'UserStory', 'Backlog', 'BacklogItem', 'Issue', 'Risk',
+    'Milestone', 'Deliverable', 'ChangeRequest', 'Baseline', 'TestCase', 'Phase', 'WorkStream',
+    'Metric', 'AIWorkProduct',
+)
+_STATUS_DOMAIN: Final[tuple[str, ...]] = (
+    'Project', 'Requirement', 'Epic', 'UserStory', 'Issue', 'Risk', 'Milestone', 'Deliverable',
+    'ChangeRequest', 'TestCase', 'Phase', 'Documentation',
+)
+_PRIORITY_DOMAIN: Final[tuple[str, ...]] = (
+    'Requirement', 'Epic', 'UserStory', 'BacklogItem', 'ChangeRequest', 'TestCase',
+)
+
+# domain_of of every slot, turned into its linkml_meta schema extra by _add_linkml_meta()
+_SLOT_DOMAINS = {
+    'id': _ID_DOMAIN,
+    'description': _DESCRIPTION_DOMAIN,
+    'status': _STATUS_DOMAIN,
+    'priority': _PRIORITY_DOMAIN,
+    'created_date': (
+        'Project', 'Requirement', 'Epic', 'Issue', 'Documentation',
+    ),
+    'last_updated': (
+        'Project', 'Requirement', 'Documentation',
+    ),
+    'start_date': ('Sprint', 'TeamMember', 'Phase'),
+    'end_date': ('Sprint', 'TeamMember', 'Phase'),
+    'owner': ('Risk', 'Documentation', 'CommunicationPlan'),
+    'version': (
+        'Deliverable', 'Baseline', 'Documentation',
+    ),
+    'email': ('Person',),
+    'communication_preferences': (
+        'Stakeholder', 'Person',
+    ),
+    'acceptance_criteria': (
+        'Scope', 'Requirement', 'UserStory', 'Milestone',
+    ),
+    'deliverables': (
+        'Milestone', 'Phase', 'WorkStream',
+    ),
+    'name': _NAME_DOMAIN,
+    'vision': ('Project',),
+    'methodology': ('Project',),
+    'business_case': ('Project',),
+    'sdlc_phase': ('Project',),
+    'release_plan': ('Project',),
+    'team': ('Project', 'WorkStream'),
+    'scope': ('Project',),
+    'stakeholders': ('Project',),
+    'risks': ('Project',),
+    'milestones': ('Project',),
+    'phases': ('Project',),
+    'knowledge_transfer': ('Project',),
+    'change_requests': ('Project',),
+    'baselines': ('Project',),
+    'repositories': ('Project',),
+    'ai_work_products': ('Project',),
+    'project_id': ('BusinessCase',),
+    'problem_statement': ('BusinessCase',),
+    'business_objectives': ('BusinessCase',),
+    'benefits': ('BusinessCase',),
+    'costs': ('BusinessCase',),
+    'roi_analysis': ('BusinessCase',),
+    'alternatives_analysis': (
+        'BusinessCase',
+    ),
+    'recommendation': ('BusinessCase',),
+    'approval_status': ('BusinessCase',),
+    'approved_date': ('BusinessCase', 'Baseline'),
+    'epics': ('Scope',),
+    'inclusions': ('Scope',),
+    'exclusions': ('Scope',),
+    'assumptions': ('Scope',),
+    'constraints': ('Scope',),
+    'requirements': ('Scope',),
+    'category': ('Requirement', 'Risk'),
+    'source': ('Requirement',),
+    'business_value': ('Epic', 'BacklogItem'),
+    'user_stories': ('Epic',),
+    'target_release': ('Epic',),
+    'title': ('UserStory', 'Issue', 'Documentation'),
+    'definition_of_done': ('UserStory',),
+    'story_points': ('UserStory',),
+    'issues': ('UserStory',),
+    'epic_id': ('UserStory',),
+    'sprint_id': ('UserStory',),
+    'tests': ('UserStory',),
+    'technical_notes': ('UserStory',),
+    'items': ('Backlog',),
+    'prioritization_method': ('Backlog',),
+    'last_prioritized_date': ('Backlog',),
+    'estimate': ('BacklogItem',),
+    'risk_level': ('BacklogItem',),
+    'dependencies': ('BacklogItem', 'WorkStream'),
+    'tags': ('BacklogItem',),
+    'goal': ('Sprint',),
+    'velocity': ('Sprint', 'Team'),
+    'retrospective_notes': ('Sprint',),
+    'daily_standup_notes': ('Sprint',),
+    'review_notes': ('Sprint',),
+    'backlog_items': ('Sprint',),
+    'committed_velocity': ('Sprint',),
+    'actual_velocity': ('Sprint',),
+    'type': (
+        'Issue', 'ChangeRequest', 'TestCase', 'Documentation', 'Repository',
+    ),
+    'severity': ('Issue',),
+    'assignee': ('Issue',),
+    'estimate_hours': ('Issue',),
+    'actual_hours': ('Issue',),
+    'due_date': ('Issue',),
+    'root_cause': ('Issue',),
+    'resolution': ('Issue',),
+    'reproduction_steps': ('Issue',),
+    'detected_version': ('Issue',),
+    'resolved_version': ('Issue',),
+    'members': ('Team',),
+    'capacity': ('Team', 'TeamMember'),
+    'focus_factor': ('Team',),
+    'process_maturity': ('Team',),
+    'collaboration_tools': ('Team',),
+    'probability': ('Risk',),
+    'impact': ('Risk',),
+    'mitigation_strategy': ('Risk',),
+    'contingency_plan': ('Risk',),
+    'triggers': ('Risk',),
+    'target_date': ('Milestone',),
+    'actual_date': ('Milestone',),
+    'acceptance_date': ('Deliverable',),
+    'quality_metrics': ('Deliverable',),
+    'storage_location': ('Deliverable',),
+    'rationale': ('ChangeRequest',),
+    'impact_analysis': ('ChangeRequest',),
+    'submitted_by': ('ChangeRequest',),
+    'submitted_date': ('ChangeRequest',),
+    'decision': ('ChangeRequest',),
+    'decision_date': ('ChangeRequest',),
+    'decision_maker': ('ChangeRequest',),
+    'approved_by': ('Baseline',),
+    'elements': ('Baseline',),
+    'test_steps': ('TestCase',),
+    'expected_result': ('TestCase',),
+    'actual_result': ('TestCase',),
+    'associated_requirement': (
+        'TestCase', 'AIWorkProduct',
+    ),
+    'automated': ('TestCase',),
+    'last_tested': ('TestCase',),
+    'entrance_criteria': ('Phase',),
+    'exit_criteria': ('Phase',),
+    'lead': ('WorkStream',),
+    'content': ('Documentation',),
+    'audience': ('Documentation', 'CommunicationPlan'),
+    'url': ('Repository',),
+    'access_controls': ('Repository',),
+    'last_sync_date': ('Repository',),
+    'value': ('Metric',),
+    'target': ('Metric',),
+    'unit': ('Metric',),
+    'measurement_date': ('Metric',),
+    'trend': ('Metric',),
+    'person_name': ('Person',),
+    'role': ('TeamMember', 'Stakeholder', 'UserProfiler'),
+    'is_active': ('TeamMember',),
+    'skills': ('TeamMember', 'UserProfiler'),
+    'influence': ('Stakeholder',),
+    'interest': ('Stakeholder',),
+    'engagement_plan': ('Stakeholder',),
+    'concerns': ('Stakeholder',),
+    'expectations': ('Stakeholder', 'UserProfiler'),
+    'experience': ('UserProfiler',),
+    'purpose': ('CommunicationPlan',),
+    'message': ('CommunicationPlan',),
+    'frequency': ('CommunicationPlan',),
+    'channel': ('CommunicationPlan',),
+    'feedback_mechanism': (
+        'CommunicationPlan',
+    ),
+    'generated_by': ('AIWorkProduct',),
+    'generation_date': ('AIWorkProduct',),
+    'input_parameters': ('AIWorkProduct',),
+    'confidence_score': ('AIWorkProduct',),
+    'validation_status': ('AIWorkProduct',),
+}
+
+# linkml_meta entries beyond alias and domain_of
+_SLOT_META_EXTRAS = {
+    'is_active': {'ifabsent': 'boolean(true)'},
+}
+
+# Length-bounded strings; minimum/maximum values on string slots in the schema are lengths
+NonEmptyStr50 = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+NonEmptyStr100 = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+NonEmptyStr500 = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+Str200 = Annotated[str, StringConstraints(max_length=200)]
+Str500 = Annotated[str, StringConstraints(max_length=500)]
+Str1000 = Annotated[str, StringConstraints(max_length=1000)]
+Str2000 = Annotated[str, StringConstraints(max_length=2000)]
+
+# Reusable annotations for slots that share the same definition across classes
+Identifier = Annotated[str, Field(default=..., description="""Unique identifier""")]
+Name = Annotated[NonEmptyStr100, Field(default=..., description="""Name""")]
+Title = Annotated[NonEmptyStr100, Field(default=..., description="""Short descriptive title""")]
+PersonName = Annotated[NonEmptyStr100, Field(default=..., description="""Person's name""")]
+OptionalDescription = Annotated[Optional[str], Field(default=None, description="""Detailed description""")]
+OptionalStatus = Annotated[Optional[str], Field(default=None, description="""Current status""")]
+OptionalPriority = Annotated[Optional[PriorityLiteral], Field(default=None, description="""Priority level""")]
+OptionalCreatedDate = Annotated[Optional[datetime], Field(default=None, description="""Creation timestamp""")]
+OptionalLastUpdated = Annotated[Optional[datetime], Field(default=None, description="""Last update timestamp""")]
+OptionalStartDate = Annotated[Optional[date], Field(default=None, description="""Start date""")]
+OptionalEndDate = Annotated[Optional[date], Field(default=None, description="""End date""")]
+OptionalOwner = Annotated[Optional[str], Field(default=None, description="""Owner""")]
+OptionalVersion = Annotated[Optional[str], Field(default=None, description="""Version""")]
+OptionalEmail = Annotated[Optional[str], Field(default=None, description="""Contact email""")]
+OptionalCommunicationPreferences = Annotated[Optional[str], Field(default=None, description="""Communication preferences""")]
+OptionalAcceptanceCriteria = Annotated[Optional[tuple[str, ...]], Field(default=None, description="""Acceptance criteria""")]
+OptionalDeliverables = Annotated[Optional[tuple[str, ...]], Field(default=None, description="""Associated deliverables""")]
+
 
 class Project(ConfiguredBaseModel):
     """
     Root entity representing the entire software project
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'methodology': {'name': 'methodology',
-                                        'range': 'MethodologyEnum',
-                                        'required': True},
-                        'sdlc_phase': {'name': 'sdlc_phase',
-                                       'range': 'SDLCPhaseEnum',
-                                       'required': True},
-                        'status': {'name': 'status', 'range': 'ProjectStatusEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    vision: Optional[str] = Field(default=None, description="""Project vision statement""", le=500, json_schema_extra = { "linkml_meta": {'alias': 'vision', 'domain_of': ['Project']} })
-    methodology: MethodologyEnum = Field(default=..., description="""Project methodology""", json_schema_extra = { "linkml_meta": {'alias': 'methodology', 'domain_of': ['Project']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    business_case: Optional[str] = Field(default=None, description="""Project business case""", json_schema_extra = { "linkml_meta": {'alias': 'business_case', 'domain_of': ['Project']} })
-    sdlc_phase: SDLCPhaseEnum = Field(default=..., description="""Current SDLC phase""", json_schema_extra = { "linkml_meta": {'alias': 'sdlc_phase', 'domain_of': ['Project']} })
-    release_plan: Optional[str] = Field(default=None, description="""High-level release plan""", le=1000, json_schema_extra = { "linkml_meta": {'alias': 'release_plan', 'domain_of': ['Project']} })
-    team: Optional[str] = Field(default=None, description="""Assigned project team""", json_schema_extra = { "linkml_meta": {'alias': 'team', 'domain_of': ['Project', 'WorkStream']} })
-    scope: Optional[Scope] = Field(default=None, description="""Project scope definition""", json_schema_extra = { "linkml_meta": {'alias': 'scope', 'domain_of': ['Project']} })
-    stakeholders: Optional[list[str]] = Field(default=None, description="""Project stakeholders""", json_schema_extra = { "linkml_meta": {'alias': 'stakeholders', 'domain_of': ['Project']} })
-    risks: Optional[list[str]] = Field(default=None, description="""Project risks""", json_schema_extra = { "linkml_meta": {'alias': 'risks', 'domain_of': ['Project']} })
-    milestones: Optional[list[str]] = Field(default=None, description="""Project milestones""", json_schema_extra = { "linkml_meta": {'alias': 'milestones', 'domain_of': ['Project']} })
-    phases: Optional[list[str]] = Field(default=None, description="""Project phases""", json_schema_extra = { "linkml_meta": {'alias': 'phases', 'domain_of': ['Project']} })
-    status: Optional[ProjectStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    created_date: Optional[str] = Field(default=None, description="""Creation timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'created_date',
-         'domain_of': ['Project', 'Requirement', 'Epic', 'Issue', 'Documentation']} })
-    last_updated: Optional[str] = Field(default=None, description="""Last update timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'last_updated',
-         'domain_of': ['Project', 'Requirement', 'Documentation']} })
-    knowledge_transfer: Optional[str] = Field(default=None, description="""Knowledge transfer activities""", le=1000, json_schema_extra = { "linkml_meta": {'alias': 'knowledge_transfer', 'domain_of': ['Project']} })
-    change_requests: Optional[list[str]] = Field(default=None, description="""Change requests""", json_schema_extra = { "linkml_meta": {'alias': 'change_requests', 'domain_of': ['Project']} })
-    baselines: Optional[list[str]] = Field(default=None, description="""Project baselines""", json_schema_extra = { "linkml_meta": {'alias': 'baselines', 'domain_of': ['Project']} })
-    repositories: Optional[list[str]] = Field(default=None, description="""Project repositories""", json_schema_extra = { "linkml_meta": {'alias': 'repositories', 'domain_of': ['Project']} })
-    ai_work_products: Optional[list[str]] = Field(default=None, description="""AI-generated work products""", json_schema_extra = { "linkml_meta": {'alias': 'ai_work_products', 'domain_of': ['Project']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    vision: Optional[Str500] = Field(default=None, description="""Project vision statement""")
+    methodology: MethodologyEnum = Field(default=..., description="""Project methodology""")
+    description: OptionalDescription
+    business_case: Optional[str] = Field(default=None, description="""Project business case""")
+    sdlc_phase: SDLCPhaseEnum = Field(default=..., description="""Current SDLC phase""")
+    release_plan: Optional[Str1000] = Field(default=None, description="""High-level release plan""")
+    team: Optional[str] = Field(default=None, description="""Assigned project team""")
+    scope: Optional[Scope] = Field(default=None, description="""Project scope definition""")
+    stakeholders: Optional[list[str]] = Field(default=None, description="""Project stakeholders""")
+    risks: Optional[list[str]] = Field(default=None, description="""Project risks""")
+    milestones: Optional[list[str]] = Field(default=None, description="""Project milestones""")
+    phases: Optional[list[str]] = Field(default=None, description="""Project phases""")
+    status: Optional[ProjectStatusEnum] = Field(default=None, description="""Current status""")
+    created_date: OptionalCreatedDate
+    last_updated: OptionalLastUpdated
+    knowledge_transfer: Optional[Str1000] = Field(default=None, description="""Knowledge transfer activities""")
+    change_requests: Optional[list[str]] = Field(default=None, description="""Change requests""")
+    baselines: Optional[list[str]] = Field(default=None, description="""Project baselines""")
+    repositories: Optional[list[str]] = Field(default=None, description="""Project repositories""")
+    ai_work_products: Optional[list[str]] = Field(default=None, description="""AI-generated work products""")
 
 
 class BusinessCase(ConfiguredBaseModel):
     """
     Justification for the project including financial and strategic considerations
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    project_id: Optional[str] = Field(default=None, description="""Reference to the project this belongs to""", json_schema_extra = { "linkml_meta": {'alias': 'project_id', 'domain_of': ['BusinessCase']} })
-    problem_statement: Optional[str] = Field(default=None, description="""Problem statement""", json_schema_extra = { "linkml_meta": {'alias': 'problem_statement', 'domain_of': ['BusinessCase']} })
-    business_objectives: Optional[list[str]] = Field(default=None, description="""Business objectives""", json_schema_extra = { "linkml_meta": {'alias': 'business_objectives', 'domain_of': ['BusinessCase']} })
-    benefits: Optional[list[str]] = Field(default=None, description="""Expected benefits""", json_schema_extra = { "linkml_meta": {'alias': 'benefits', 'domain_of': ['BusinessCase']} })
-    costs: Optional[str] = Field(default=None, description="""Estimated costs""", json_schema_extra = { "linkml_meta": {'alias': 'costs', 'domain_of': ['BusinessCase']} })
-    roi_analysis: Optional[str] = Field(default=None, description="""ROI analysis""", json_schema_extra = { "linkml_meta": {'alias': 'roi_analysis', 'domain_of': ['BusinessCase']} })
-    alternatives_analysis: Optional[str] = Field(default=None, description="""Alternatives analysis""", json_schema_extra = { "linkml_meta": {'alias': 'alternatives_analysis', 'domain_of': ['BusinessCase']} })
-    recommendation: Optional[str] = Field(default=None, description="""Recommendation""", json_schema_extra = { "linkml_meta": {'alias': 'recommendation', 'domain_of': ['BusinessCase']} })
-    approval_status: Optional[ApprovalStatusEnum] = Field(default=None, description="""Approval status""", json_schema_extra = { "linkml_meta": {'alias': 'approval_status', 'domain_of': ['BusinessCase']} })
-    approved_date: Optional[str] = Field(default=None, description="""Approval date""", json_schema_extra = { "linkml_meta": {'alias': 'approved_date', 'domain_of': ['BusinessCase', 'Baseline']} })
+    __slots__ = ()
+
+    id: Identifier
+    project_id: Optional[str] = Field(default=None, description="""Reference to the project this belongs to""")
+    problem_statement: Optional[str] = Field(default=None, description="""Problem statement""")
+    business_objectives: Optional[list[str]] = Field(default=None, description="""Business objectives""")
+    benefits: Optional[list[str]] = Field(default=None, description="""Expected benefits""")
+    costs: Optional[str] = Field(default=None, description="""Estimated costs""")
+    roi_analysis: Optional[str] = Field(default=None, description="""ROI analysis""")
+    alternatives_analysis: Optional[str] = Field(default=None, description="""Alternatives analysis""")
+    recommendation: Optional[str] = Field(default=None, description="""Recommendation""")
+    approval_status: Optional[ApprovalStatusEnum] = Field(default=None, description="""Approval status""")
+    approved_date: Optional[date] = Field(default=None, description="""Approval date""")
 
 
 class Scope(ConfiguredBaseModel):
     """
     Project scope definition with inclusions, exclusions, and constraints
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
+    __slots__ = ()
 
-    epics: Optional[list[str]] = Field(default=None, description="""Collection of epics""", json_schema_extra = { "linkml_meta": {'alias': 'epics', 'domain_of': ['Scope']} })
-    inclusions: Optional[list[str]] = Field(default=None, description="""Included items in scope""", le=50, json_schema_extra = { "linkml_meta": {'alias': 'inclusions', 'domain_of': ['Scope']} })
-    exclusions: Optional[list[str]] = Field(default=None, description="""Excluded items from scope""", le=50, json_schema_extra = { "linkml_meta": {'alias': 'exclusions', 'domain_of': ['Scope']} })
-    assumptions: Optional[list[str]] = Field(default=None, description="""Scope assumptions""", json_schema_extra = { "linkml_meta": {'alias': 'assumptions', 'domain_of': ['Scope']} })
-    constraints: Optional[list[str]] = Field(default=None, description="""Scope constraints""", json_schema_extra = { "linkml_meta": {'alias': 'constraints', 'domain_of': ['Scope']} })
-    acceptance_criteria: Optional[list[str]] = Field(default=None, description="""Acceptance criteria""", json_schema_extra = { "linkml_meta": {'alias': 'acceptance_criteria',
-         'domain_of': ['Scope', 'Requirement', 'UserStory', 'Milestone']} })
-    requirements: Optional[list[str]] = Field(default=None, description="""Project requirements""", json_schema_extra = { "linkml_meta": {'alias': 'requirements', 'domain_of': ['Scope']} })
+    epics: Optional[list[str]] = Field(default=None, description="""Collection of epics""")
+    inclusions: Optional[list[str]] = Field(default=None, description="""Included items in scope""", max_length=50)
+    exclusions: Optional[list[str]] = Field(default=None, description="""Excluded items from scope""", max_length=50)
+    assumptions: Optional[list[str]] = Field(default=None, description="""Scope assumptions""")
+    constraints: Optional[list[str]] = Field(default=None, description="""Scope constraints""")
+    acceptance_criteria: OptionalAcceptanceCriteria
+    requirements: Optional[list[str]] = Field(default=None, description="""Project requirements""")
 
 
 class Requirement(ConfiguredBaseModel):
     """
     Single discrete requirement with unique identifier and traceability
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    category: Optional[RiskCategoryEnum] = Field(default=None, description="""Risk category""", json_schema_extra = { "linkml_meta": {'alias': 'category', 'domain_of': ['Requirement', 'Risk']} })
-    priority: Optional[PriorityEnum] = Field(default=None, description="""Priority level""", json_schema_extra = { "linkml_meta": {'alias': 'priority',
-         'domain_of': ['Requirement',
-                       'Epic',
-                       'UserStory',
-                       'BacklogItem',
-                       'ChangeRequest',
-                       'TestCase']} })
-    status: Optional[str] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    source: Optional[str] = Field(default=None, description="""Source of the requirement""", json_schema_extra = { "linkml_meta": {'alias': 'source', 'domain_of': ['Requirement']} })
-    acceptance_criteria: Optional[list[str]] = Field(default=None, description="""Acceptance criteria""", json_schema_extra = { "linkml_meta": {'alias': 'acceptance_criteria',
-         'domain_of': ['Scope', 'Requirement', 'UserStory', 'Milestone']} })
-    created_date: Optional[str] = Field(default=None, description="""Creation timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'created_date',
-         'domain_of': ['Project', 'Requirement', 'Epic', 'Issue', 'Documentation']} })
-    last_updated: Optional[str] = Field(default=None, description="""Last update timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'last_updated',
-         'domain_of': ['Project', 'Requirement', 'Documentation']} })
+    __slots__ = ()
+
+    id: Identifier
+    description: OptionalDescription
+    category: Optional[RiskCategoryEnum] = Field(default=None, description="""Risk category""")
+    priority: OptionalPriority
+    status: OptionalStatus
+    source: Optional[str] = Field(default=None, description="""Source of the requirement""")
+    acceptance_criteria: OptionalAcceptanceCriteria
+    created_date: OptionalCreatedDate
+    last_updated: OptionalLastUpdated
 
 
 class Epic(ConfiguredBaseModel):
     """
     Large work body capturing major capability with traceability to business objectives
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
-                        'status': {'name': 'status', 'range': 'EpicStatusEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", le=500, json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    business_value: Optional[int] = Field(default=None, description="""Business value score (1-10)""", ge=1, le=10, json_schema_extra = { "linkml_meta": {'alias': 'business_value', 'domain_of': ['Epic', 'BacklogItem']} })
-    user_stories: Optional[list[str]] = Field(default=None, description="""User stories""", json_schema_extra = { "linkml_meta": {'alias': 'user_stories', 'domain_of': ['Epic']} })
-    priority: Optional[PriorityEnum] = Field(default=None, description="""Priority level""", json_schema_extra = { "linkml_meta": {'alias': 'priority',
-         'domain_of': ['Requirement',
-                       'Epic',
-                       'UserStory',
-                       'BacklogItem',
-                       'ChangeRequest',
-                       'TestCase']} })
-    status: Optional[EpicStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    created_date: Optional[str] = Field(default=None, description="""Creation timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'created_date',
-         'domain_of': ['Project', 'Requirement', 'Epic', 'Issue', 'Documentation']} })
-    target_release: Optional[str] = Field(default=None, description="""Target release version""", json_schema_extra = { "linkml_meta": {'alias': 'target_release', 'domain_of': ['Epic']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: Optional[Str500] = Field(default=None, description="""Detailed description""")
+    business_value: Optional[int] = Field(default=None, description="""Business value score (1-10)""", ge=1, le=10)
+    user_stories: Optional[list[str]] = Field(default=None, description="""User stories""")
+    priority: OptionalPriority
+    status: Optional[EpicStatusEnum] = Field(default=None, description="""Current status""")
+    created_date: OptionalCreatedDate
+    target_release: Optional[str] = Field(default=None, description="""Target release version""")
 
 
 class UserStory(ConfiguredBaseModel):
     """
     End-user perspective feature description with acceptance criteria
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'acceptance_criteria': {'maximum_value': 10,
-                                                'minimum_value': 1,
-                                                'name': 'acceptance_criteria',
-                                                'required': True},
-                        'description': {'maximum_value': 1000, 'name': 'description'},
-                        'status': {'name': 'status', 'range': 'UserStoryStatusEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    title: str = Field(default=..., description="""Short descriptive title""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'title', 'domain_of': ['UserStory', 'Issue', 'Documentation']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", le=1000, json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    acceptance_criteria: list[str] = Field(default=..., description="""Acceptance criteria""", ge=1, le=10, json_schema_extra = { "linkml_meta": {'alias': 'acceptance_criteria',
-         'domain_of': ['Scope', 'Requirement', 'UserStory', 'Milestone']} })
-    definition_of_done: Optional[str] = Field(default=None, description="""Definition of done criteria""", le=1000, json_schema_extra = { "linkml_meta": {'alias': 'definition_of_done', 'domain_of': ['UserStory']} })
-    story_points: StoryPointsEnum = Field(default=..., description="""Relative complexity estimate using Fibonacci sequence.""", json_schema_extra = { "linkml_meta": {'alias': 'story_points', 'domain_of': ['UserStory']} })
-    issues: Optional[list[str]] = Field(default=None, description="""Associated issues""", json_schema_extra = { "linkml_meta": {'alias': 'issues', 'domain_of': ['UserStory']} })
-    epic_id: Optional[str] = Field(default=None, description="""Parent epic reference""", json_schema_extra = { "linkml_meta": {'alias': 'epic_id', 'domain_of': ['UserStory']} })
-    sprint_id: Optional[str] = Field(default=None, description="""Sprint assignment reference""", json_schema_extra = { "linkml_meta": {'alias': 'sprint_id', 'domain_of': ['UserStory']} })
-    status: Optional[UserStoryStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    priority: Optional[PriorityEnum] = Field(default=None, description="""Priority level""", json_schema_extra = { "linkml_meta": {'alias': 'priority',
-         'domain_of': ['Requirement',
-                       'Epic',
-                       'UserStory',
-                       'BacklogItem',
-                       'ChangeRequest',
-                       'TestCase']} })
-    tests: Optional[list[str]] = Field(default=None, description="""Associated test cases""", json_schema_extra = { "linkml_meta": {'alias': 'tests', 'domain_of': ['UserStory']} })
-    technical_notes: Optional[str] = Field(default=None, description="""Technical notes""", json_schema_extra = { "linkml_meta": {'alias': 'technical_notes', 'domain_of': ['UserStory']} })
+    __slots__ = ()
+
+    id: Identifier
+    title: Title
+    description: Optional[Str1000] = Field(default=None, description="""Detailed description""")
+    acceptance_criteria: tuple[str, ...] = Field(default=..., description="""Acceptance criteria""", min_length=1, max_length=10)
+    definition_of_done: Optional[Str1000] = Field(default=None, description="""Definition of done criteria""")
+    story_points: StoryPointsLiteral = Field(default=..., description="""Relative complexity estimate using Fibonacci sequence.""")
+    issues: Optional[tuple[str, ...]] = Field(default=None, description="""Associated issues""")
+    epic_id: Optional[str] = Field(default=None, description="""Parent epic reference""")
+    sprint_id: Optional[str] = Field(default=None, description="""Sprint assignment reference""")
+    status: Optional[UserStoryStatusLiteral] = Field(default=None, description="""Current status""")
+    priority: OptionalPriority
+    tests: Optional[tuple[str, ...]] = Field(default=None, description="""Associated test cases""")
+    technical_notes: Optional[str] = Field(default=None, description="""Technical notes""")
 
 
 class Backlog(ConfiguredBaseModel):
     """
     Ordered list of work items awaiting execution
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    items: Optional[list[str]] = Field(default=None, description="""Backlog items""", json_schema_extra = { "linkml_meta": {'alias': 'items', 'domain_of': ['Backlog']} })
-    prioritization_method: Optional[str] = Field(default=None, description="""Prioritization method""", json_schema_extra = { "linkml_meta": {'alias': 'prioritization_method', 'domain_of': ['Backlog']} })
-    last_prioritized_date: Optional[str] = Field(default=None, description="""Last prioritization date""", json_schema_extra = { "linkml_meta": {'alias': 'last_prioritized_date', 'domain_of': ['Backlog']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    items: Optional[list[str]] = Field(default=None, description="""Backlog items""")
+    prioritization_method: Optional[str] = Field(default=None, description="""Prioritization method""")
+    last_prioritized_date: Optional[date] = Field(default=None, description="""Last prioritization date""")
 
 
 class BacklogItem(ConfiguredBaseModel):
     """
     Single item in a backlog with estimation and prioritization data
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    estimate: Optional[int] = Field(default=None, description="""Effort estimate""", json_schema_extra = { "linkml_meta": {'alias': 'estimate', 'domain_of': ['BacklogItem']} })
-    priority: Optional[PriorityEnum] = Field(default=None, description="""Priority level""", json_schema_extra = { "linkml_meta": {'alias': 'priority',
-         'domain_of': ['Requirement',
-                       'Epic',
-                       'UserStory',
-                       'BacklogItem',
-                       'ChangeRequest',
-                       'TestCase']} })
-    risk_level: Optional[SeverityEnum] = Field(default=None, description="""Risk level""", json_schema_extra = { "linkml_meta": {'alias': 'risk_level', 'domain_of': ['BacklogItem']} })
-    business_value: Optional[int] = Field(default=None, description="""Business value score (1-10)""", ge=1, le=10, json_schema_extra = { "linkml_meta": {'alias': 'business_value', 'domain_of': ['Epic', 'BacklogItem']} })
-    dependencies: Optional[list[str]] = Field(default=None, description="""Dependencies""", json_schema_extra = { "linkml_meta": {'alias': 'dependencies', 'domain_of': ['BacklogItem', 'WorkStream']} })
-    tags: Optional[list[str]] = Field(default=None, description="""Tags""", json_schema_extra = { "linkml_meta": {'alias': 'tags', 'domain_of': ['BacklogItem']} })
+    __slots__ = ()
+
+    id: Identifier
+    description: OptionalDescription
+    estimate: Optional[int] = Field(default=None, description="""Effort estimate""")
+    priority: OptionalPriority
+    risk_level: Optional[SeverityLiteral] = Field(default=None, description="""Risk level""")
+    business_value: Optional[int] = Field(default=None, description="""Business value score (1-10)""", ge=1, le=10)
+    dependencies: Optional[tuple[str, ...]] = Field(default=None, description="""Dependencies""")
+    tags: Optional[tuple[str, ...]] = Field(default=None, description="""Tags""")
 
 
 class Sprint(ConfiguredBaseModel):
     """
     Time-boxed iteration typically 1-4 weeks in duration
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'name': {'maximum_value': 50, 'name': 'name'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=50, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    goal: Optional[str] = Field(default=None, description="""Goal description""", le=200, json_schema_extra = { "linkml_meta": {'alias': 'goal', 'domain_of': ['Sprint']} })
-    start_date: Optional[str] = Field(default=None, description="""Start date""", json_schema_extra = { "linkml_meta": {'alias': 'start_date', 'domain_of': ['Sprint', 'TeamMember', 'Phase']} })
-    end_date: Optional[str] = Field(default=None, description="""End date""", json_schema_extra = { "linkml_meta": {'alias': 'end_date', 'domain_of': ['Sprint', 'TeamMember', 'Phase']} })
-    velocity: Optional[float] = Field(default=None, description="""Team velocity""", ge=0, json_schema_extra = { "linkml_meta": {'alias': 'velocity', 'domain_of': ['Sprint', 'Team']} })
-    retrospective_notes: Optional[str] = Field(default=None, description="""Retrospective notes""", json_schema_extra = { "linkml_meta": {'alias': 'retrospective_notes', 'domain_of': ['Sprint']} })
-    daily_standup_notes: Optional[str] = Field(default=None, description="""Daily standup notes""", le=2000, json_schema_extra = { "linkml_meta": {'alias': 'daily_standup_notes', 'domain_of': ['Sprint']} })
-    review_notes: Optional[str] = Field(default=None, description="""Review notes""", le=2000, json_schema_extra = { "linkml_meta": {'alias': 'review_notes', 'domain_of': ['Sprint']} })
-    backlog_items: Optional[list[str]] = Field(default=None, description="""Items in the backlog""", json_schema_extra = { "linkml_meta": {'alias': 'backlog_items', 'domain_of': ['Sprint']} })
-    committed_velocity: Optional[float] = Field(default=None, description="""Committed velocity""", json_schema_extra = { "linkml_meta": {'alias': 'committed_velocity', 'domain_of': ['Sprint']} })
-    actual_velocity: Optional[float] = Field(default=None, description="""Actual velocity""", json_schema_extra = { "linkml_meta": {'alias': 'actual_velocity', 'domain_of': ['Sprint']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: NonEmptyStr50 = Field(default=..., description="""Name""")
+    goal: Optional[Str200] = Field(default=None, description="""Goal description""")
+    start_date: OptionalStartDate
+    end_date: OptionalEndDate
+    velocity: Optional[float] = Field(default=None, description="""Team velocity""", ge=0)
+    retrospective_notes: Optional[str] = Field(default=None, description="""Retrospective notes""")
+    daily_standup_notes: Optional[Str2000] = Field(default=None, description="""Daily standup notes""")
+    review_notes: Optional[Str2000] = Field(default=None, description="""Review notes""")
+    backlog_items: Optional[tuple[str, ...]] = Field(default=None, description="""Items in the backlog""")
+    committed_velocity: Optional[float] = Field(default=None, description="""Committed velocity""")
+    actual_velocity: Optional[float] = Field(default=None, description="""Actual velocity""")
 
 
 class Issue(ConfiguredBaseModel):
     """
     Technical task or problem resolution item
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
-                        'status': {'name': 'status', 'range': 'IssueStatusEnum'},
-                        'type': {'name': 'type', 'range': 'IssueTypeEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    title: str = Field(default=..., description="""Short descriptive title""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'title', 'domain_of': ['UserStory', 'Issue', 'Documentation']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", le=500, json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    type: Optional[IssueTypeEnum] = Field(default=None, description="""Type classification""", json_schema_extra = { "linkml_meta": {'alias': 'type',
-         'domain_of': ['Issue',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Documentation',
-                       'Repository']} })
-    status: Optional[IssueStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    severity: Optional[SeverityEnum] = Field(default=None, description="""Severity level""", json_schema_extra = { "linkml_meta": {'alias': 'severity', 'domain_of': ['Issue']} })
-    assignee: Optional[str] = Field(default=None, description="""Assigned person""", json_schema_extra = { "linkml_meta": {'alias': 'assignee', 'domain_of': ['Issue']} })
-    estimate_hours: Optional[float] = Field(default=None, description="""Time estimate in hours""", ge=0, json_schema_extra = { "linkml_meta": {'alias': 'estimate_hours', 'domain_of': ['Issue']} })
-    actual_hours: Optional[float] = Field(default=None, description="""Actual time spent in hours""", ge=0, json_schema_extra = { "linkml_meta": {'alias': 'actual_hours', 'domain_of': ['Issue']} })
-    due_date: Optional[str] = Field(default=None, description="""Target completion date""", json_schema_extra = { "linkml_meta": {'alias': 'due_date', 'domain_of': ['Issue']} })
-    created_date: Optional[str] = Field(default=None, description="""Creation timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'created_date',
-         'domain_of': ['Project', 'Requirement', 'Epic', 'Issue', 'Documentation']} })
-    root_cause: Optional[str] = Field(default=None, description="""Root cause analysis""", json_schema_extra = { "linkml_meta": {'alias': 'root_cause', 'domain_of': ['Issue']} })
-    resolution: Optional[str] = Field(default=None, description="""Resolution description""", json_schema_extra = { "linkml_meta": {'alias': 'resolution', 'domain_of': ['Issue']} })
-    reproduction_steps: Optional[str] = Field(default=None, description="""Reproduction steps""", json_schema_extra = { "linkml_meta": {'alias': 'reproduction_steps', 'domain_of': ['Issue']} })
-    detected_version: Optional[str] = Field(default=None, description="""Detected in version""", json_schema_extra = { "linkml_meta": {'alias': 'detected_version', 'domain_of': ['Issue']} })
-    resolved_version: Optional[str] = Field(default=None, description="""Resolved in version""", json_schema_extra = { "linkml_meta": {'alias': 'resolved_version', 'domain_of': ['Issue']} })
+    __slots__ = ()
+
+    id: Identifier
+    title: Title
+    description: Optional[Str500] = Field(default=None, description="""Detailed description""")
+    type: Optional[IssueTypeLiteral] = Field(default=None, description="""Type classification""")
+    status: Optional[IssueStatusEnum] = Field(default=None, description="""Current status""")
+    severity: Optional[SeverityLiteral] = Field(default=None, description="""Severity level""")
+    assignee: Optional[str] = Field(default=None, description="""Assigned person""")
+    estimate_hours: Optional[float] = Field(default=None, description="""Time estimate in hours""", ge=0)
+    actual_hours: Optional[float] = Field(default=None, description="""Actual time spent in hours""", ge=0)
+    due_date: Optional[date] = Field(default=None, description="""Target completion date""")
+    created_date: OptionalCreatedDate
+    root_cause: Optional[str] = Field(default=None, description="""Root cause analysis""")
+    resolution: Optional[str] = Field(default=None, description="""Resolution description""")
+    reproduction_steps: Optional[str] = Field(default=None, description="""Reproduction steps""")
+    detected_version: Optional[str] = Field(default=None, description="""Detected in version""")
+    resolved_version: Optional[str] = Field(default=None, description="""Resolved in version""")
 
 
 class Team(ConfiguredBaseModel):
     """
     Cross-functional team responsible for project delivery
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    members: Optional[list[str]] = Field(default=None, description="""Team members""", json_schema_extra = { "linkml_meta": {'alias': 'members', 'domain_of': ['Team']} })
-    velocity: Optional[float] = Field(default=None, description="""Team velocity""", ge=0, json_schema_extra = { "linkml_meta": {'alias': 'velocity', 'domain_of': ['Sprint', 'Team']} })
-    capacity: Optional[float] = Field(default=None, description="""Weekly capacity in hours""", ge=0, json_schema_extra = { "linkml_meta": {'alias': 'capacity', 'domain_of': ['Team', 'TeamMember']} })
-    focus_factor: Optional[float] = Field(default=None, description="""Team focus factor""", json_schema_extra = { "linkml_meta": {'alias': 'focus_factor', 'domain_of': ['Team']} })
-    process_maturity: Optional[int] = Field(default=None, description="""Process maturity level (1-5)""", ge=1, le=5, json_schema_extra = { "linkml_meta": {'alias': 'process_maturity', 'domain_of': ['Team']} })
-    collaboration_tools: Optional[list[str]] = Field(default=None, description="""Collaboration tools""", json_schema_extra = { "linkml_meta": {'alias': 'collaboration_tools', 'domain_of': ['Team']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    members: Optional[tuple[str, ...]] = Field(default=None, description="""Team members""")
+    velocity: Optional[float] = Field(default=None, description="""Team velocity""", ge=0)
+    capacity: Optional[float] = Field(default=None, description="""Weekly capacity in hours""", ge=0)
+    focus_factor: Optional[float] = Field(default=None, description="""Team focus factor""")
+    process_maturity: Optional[int] = Field(default=None, description="""Process maturity level (1-5)""", ge=1, le=5)
+    collaboration_tools: Optional[tuple[str, ...]] = Field(default=None, description="""Collaboration tools""")
 
 
 class Risk(ConfiguredBaseModel):
     """
     Project risk following PMI risk management framework
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'description': {'maximum_value': 500,
-                                        'minimum_value': 1,
-                                        'name': 'description',
-                                        'required': True},
-                        'status': {'name': 'status', 'range': 'RiskStatusEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    description: str = Field(default=..., description="""Detailed description""", ge=1, le=500, json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    category: Optional[RiskCategoryEnum] = Field(default=None, description="""Risk category""", json_schema_extra = { "linkml_meta": {'alias': 'category', 'domain_of': ['Requirement', 'Risk']} })
-    probability: Optional[InfluenceLevelEnum] = Field(default=None, description="""Probability of occurrence""", json_schema_extra = { "linkml_meta": {'alias': 'probability', 'domain_of': ['Risk']} })
-    impact: Optional[InfluenceLevelEnum] = Field(default=None, description="""Impact level""", json_schema_extra = { "linkml_meta": {'alias': 'impact', 'domain_of': ['Risk']} })
-    mitigation_strategy: Optional[str] = Field(default=None, description="""Mitigation strategy""", json_schema_extra = { "linkml_meta": {'alias': 'mitigation_strategy', 'domain_of': ['Risk']} })
-    contingency_plan: Optional[str] = Field(default=None, description="""Contingency plan""", json_schema_extra = { "linkml_meta": {'alias': 'contingency_plan', 'domain_of': ['Risk']} })
-    status: Optional[RiskStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    triggers: Optional[list[str]] = Field(default=None, description="""Risk triggers""", json_schema_extra = { "linkml_meta": {'alias': 'triggers', 'domain_of': ['Risk']} })
-    owner: Optional[str] = Field(default=None, description="""Owner""", json_schema_extra = { "linkml_meta": {'alias': 'owner', 'domain_of': ['Risk', 'Documentation', 'CommunicationPlan']} })
+    __slots__ = ()
+
+    id: Identifier
+    description: NonEmptyStr500 = Field(default=..., description="""Detailed description""")
+    category: Optional[RiskCategoryEnum] = Field(default=None, description="""Risk category""")
+    probability: Optional[InfluenceLevelEnum] = Field(default=None, description="""Probability of occurrence""")
+    impact: Optional[InfluenceLevelEnum] = Field(default=None, description="""Impact level""")
+    mitigation_strategy: Optional[str] = Field(default=None, description="""Mitigation strategy""")
+    contingency_plan: Optional[str] = Field(default=None, description="""Contingency plan""")
+    status: Optional[RiskStatusEnum] = Field(default=None, description="""Current status""")
+    triggers: Optional[tuple[str, ...]] = Field(default=None, description="""Risk triggers""")
+    owner: OptionalOwner
 
 
 class Milestone(ConfiguredBaseModel):
     """
     Significant point in project timeline with deliverable tracking
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
-                        'status': {'name': 'status', 'range': 'MilestoneStatusEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", le=500, json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    target_date: Optional[str] = Field(default=None, description="""Planned completion date""", json_schema_extra = { "linkml_meta": {'alias': 'target_date', 'domain_of': ['Milestone']} })
-    actual_date: Optional[str] = Field(default=None, description="""Actual completion date""", json_schema_extra = { "linkml_meta": {'alias': 'actual_date', 'domain_of': ['Milestone']} })
-    deliverables: Optional[list[str]] = Field(default=None, description="""Associated deliverables""", json_schema_extra = { "linkml_meta": {'alias': 'deliverables', 'domain_of': ['Milestone', 'Phase', 'WorkStream']} })
-    status: Optional[MilestoneStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    acceptance_criteria: Optional[list[str]] = Field(default=None, description="""Acceptance criteria""", json_schema_extra = { "linkml_meta": {'alias': 'acceptance_criteria',
-         'domain_of': ['Scope', 'Requirement', 'UserStory', 'Milestone']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: Optional[Str500] = Field(default=None, description="""Detailed description""")
+    target_date: Optional[date] = Field(default=None, description="""Planned completion date""")
+    actual_date: Optional[date] = Field(default=None, description="""Actual completion date""")
+    deliverables: OptionalDeliverables
+    status: Optional[MilestoneStatusEnum] = Field(default=None, description="""Current status""")
+    acceptance_criteria: OptionalAcceptanceCriteria
 
 
 class Deliverable(ConfiguredBaseModel):
     """
     Tangible or intangible product produced as part of project completion
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'description': {'maximum_value': 500, 'name': 'description'},
-                        'status': {'name': 'status', 'range': 'DeliverableStatusEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", le=500, json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    status: Optional[DeliverableStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    acceptance_date: Optional[str] = Field(default=None, description="""Acceptance date""", json_schema_extra = { "linkml_meta": {'alias': 'acceptance_date', 'domain_of': ['Deliverable']} })
-    quality_metrics: Optional[str] = Field(default=None, description="""Quality metrics""", json_schema_extra = { "linkml_meta": {'alias': 'quality_metrics', 'domain_of': ['Deliverable']} })
-    storage_location: Optional[str] = Field(default=None, description="""Storage location""", json_schema_extra = { "linkml_meta": {'alias': 'storage_location', 'domain_of': ['Deliverable']} })
-    version: Optional[str] = Field(default=None, description="""Version""", json_schema_extra = { "linkml_meta": {'alias': 'version', 'domain_of': ['Deliverable', 'Baseline', 'Documentation']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: Optional[Str500] = Field(default=None, description="""Detailed description""")
+    status: Optional[DeliverableStatusEnum] = Field(default=None, description="""Current status""")
+    acceptance_date: Optional[date] = Field(default=None, description="""Acceptance date""")
+    quality_metrics: Optional[str] = Field(default=None, description="""Quality metrics""")
+    storage_location: Optional[str] = Field(default=None, description="""Storage location""")
+    version: OptionalVersion
 
 
 class ChangeRequest(ConfiguredBaseModel):
     """
     Formal request to modify project baselines
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'status': {'name': 'status', 'range': 'ApprovalStatusEnum'},
-                        'type': {'name': 'type', 'range': 'ChangeTypeEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    rationale: Optional[str] = Field(default=None, description="""Rationale""", json_schema_extra = { "linkml_meta": {'alias': 'rationale', 'domain_of': ['ChangeRequest']} })
-    impact_analysis: Optional[str] = Field(default=None, description="""Impact analysis""", json_schema_extra = { "linkml_meta": {'alias': 'impact_analysis', 'domain_of': ['ChangeRequest']} })
-    priority: Optional[PriorityEnum] = Field(default=None, description="""Priority level""", json_schema_extra = { "linkml_meta": {'alias': 'priority',
-         'domain_of': ['Requirement',
-                       'Epic',
-                       'UserStory',
-                       'BacklogItem',
-                       'ChangeRequest',
-                       'TestCase']} })
-    type: Optional[ChangeTypeEnum] = Field(default=None, description="""Type classification""", json_schema_extra = { "linkml_meta": {'alias': 'type',
-         'domain_of': ['Issue',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Documentation',
-                       'Repository']} })
-    status: Optional[ApprovalStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    submitted_by: Optional[str] = Field(default=None, description="""Submitted by""", json_schema_extra = { "linkml_meta": {'alias': 'submitted_by', 'domain_of': ['ChangeRequest']} })
-    submitted_date: Optional[str] = Field(default=None, description="""Submission date""", json_schema_extra = { "linkml_meta": {'alias': 'submitted_date', 'domain_of': ['ChangeRequest']} })
-    decision: Optional[str] = Field(default=None, description="""Decision""", json_schema_extra = { "linkml_meta": {'alias': 'decision', 'domain_of': ['ChangeRequest']} })
-    decision_date: Optional[str] = Field(default=None, description="""Decision date""", json_schema_extra = { "linkml_meta": {'alias': 'decision_date', 'domain_of': ['ChangeRequest']} })
-    decision_maker: Optional[str] = Field(default=None, description="""Decision maker""", json_schema_extra = { "linkml_meta": {'alias': 'decision_maker', 'domain_of': ['ChangeRequest']} })
+    __slots__ = ()
+
+    id: Identifier
+    description: OptionalDescription
+    rationale: Optional[str] = Field(default=None, description="""Rationale""")
+    impact_analysis: Optional[str] = Field(default=None, description="""Impact analysis""")
+    priority: OptionalPriority
+    type: Optional[ChangeTypeEnum] = Field(default=None, description="""Type classification""")
+    status: Optional[ApprovalStatusEnum] = Field(default=None, description="""Current status""")
+    submitted_by: Optional[str] = Field(default=None, description="""Submitted by""")
+    submitted_date: Optional[date] = Field(default=None, description="""Submission date""")
+    decision: Optional[str] = Field(default=None, description="""Decision""")
+    decision_date: Optional[date] = Field(default=None, description="""Decision date""")
+    decision_maker: Optional[str] = Field(default=None, description="""Decision maker""")
 
 
 class Baseline(ConfiguredBaseModel):
     """
     Approved version of scope, schedule, or cost used for comparison
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    version: Optional[str] = Field(default=None, description="""Version""", json_schema_extra = { "linkml_meta": {'alias': 'version', 'domain_of': ['Deliverable', 'Baseline', 'Documentation']} })
-    approved_date: Optional[str] = Field(default=None, description="""Approval date""", json_schema_extra = { "linkml_meta": {'alias': 'approved_date', 'domain_of': ['BusinessCase', 'Baseline']} })
-    approved_by: Optional[str] = Field(default=None, description="""Person who approved the baseline""", json_schema_extra = { "linkml_meta": {'alias': 'approved_by', 'domain_of': ['Baseline']} })
-    elements: Optional[list[str]] = Field(default=None, description="""Baseline elements""", json_schema_extra = { "linkml_meta": {'alias': 'elements', 'domain_of': ['Baseline']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    version: OptionalVersion
+    approved_date: Optional[date] = Field(default=None, description="""Approval date""")
+    approved_by: Optional[str] = Field(default=None, description="""Person who approved the baseline""")
+    elements: Optional[tuple[str, ...]] = Field(default=None, description="""Baseline elements""")
 
 
 class TestCase(ConfiguredBaseModel):
     """
     Verifiable condition for requirement validation
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'type': {'name': 'type', 'range': 'TestTypeEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    test_steps: Optional[list[str]] = Field(default=None, description="""Test steps""", json_schema_extra = { "linkml_meta": {'alias': 'test_steps', 'domain_of': ['TestCase']} })
-    expected_result: Optional[str] = Field(default=None, description="""Expected result""", json_schema_extra = { "linkml_meta": {'alias': 'expected_result', 'domain_of': ['TestCase']} })
-    actual_result: Optional[str] = Field(default=None, description="""Actual result""", json_schema_extra = { "linkml_meta": {'alias': 'actual_result', 'domain_of': ['TestCase']} })
-    status: Optional[str] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    type: Optional[TestTypeEnum] = Field(default=None, description="""Type classification""", json_schema_extra = { "linkml_meta": {'alias': 'type',
-         'domain_of': ['Issue',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Documentation',
-                       'Repository']} })
-    priority: Optional[PriorityEnum] = Field(default=None, description="""Priority level""", json_schema_extra = { "linkml_meta": {'alias': 'priority',
-         'domain_of': ['Requirement',
-                       'Epic',
-                       'UserStory',
-                       'BacklogItem',
-                       'ChangeRequest',
-                       'TestCase']} })
-    associated_requirement: Optional[str] = Field(default=None, description="""Associated requirement""", json_schema_extra = { "linkml_meta": {'alias': 'associated_requirement', 'domain_of': ['TestCase', 'AIWorkProduct']} })
-    automated: Optional[bool] = Field(default=None, description="""Automated test""", json_schema_extra = { "linkml_meta": {'alias': 'automated', 'domain_of': ['TestCase']} })
-    last_tested: Optional[str] = Field(default=None, description="""Last tested date""", json_schema_extra = { "linkml_meta": {'alias': 'last_tested', 'domain_of': ['TestCase']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    test_steps: Optional[tuple[str, ...]] = Field(default=None, description="""Test steps""")
+    expected_result: Optional[str] = Field(default=None, description="""Expected result""")
+    actual_result: Optional[str] = Field(default=None, description="""Actual result""")
+    status: OptionalStatus
+    type: Optional[TestTypeEnum] = Field(default=None, description="""Type classification""")
+    priority: OptionalPriority
+    associated_requirement: Optional[str] = Field(default=None, description="""Associated requirement""")
+    automated: Optional[bool] = Field(default=None, description="""Automated test""")
+    last_tested: Optional[date] = Field(default=None, description="""Last tested date""")
 
 
 class Phase(ConfiguredBaseModel):
     """
     Distinct time period in predictive project lifecycles
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    start_date: Optional[str] = Field(default=None, description="""Start date""", json_schema_extra = { "linkml_meta": {'alias': 'start_date', 'domain_of': ['Sprint', 'TeamMember', 'Phase']} })
-    end_date: Optional[str] = Field(default=None, description="""End date""", json_schema_extra = { "linkml_meta": {'alias': 'end_date', 'domain_of': ['Sprint', 'TeamMember', 'Phase']} })
-    deliverables: Optional[list[str]] = Field(default=None, description="""Associated deliverables""", json_schema_extra = { "linkml_meta": {'alias': 'deliverables', 'domain_of': ['Milestone', 'Phase', 'WorkStream']} })
-    entrance_criteria: Optional[str] = Field(default=None, description="""Entrance criteria""", json_schema_extra = { "linkml_meta": {'alias': 'entrance_criteria', 'domain_of': ['Phase']} })
-    exit_criteria: Optional[str] = Field(default=None, description="""Exit criteria""", json_schema_extra = { "linkml_meta": {'alias': 'exit_criteria', 'domain_of': ['Phase']} })
-    status: Optional[str] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    start_date: OptionalStartDate
+    end_date: OptionalEndDate
+    deliverables: OptionalDeliverables
+    entrance_criteria: Optional[str] = Field(default=None, description="""Entrance criteria""")
+    exit_criteria: Optional[str] = Field(default=None, description="""Exit criteria""")
+    status: OptionalStatus
 
 
 class WorkStream(ConfiguredBaseModel):
     """
     Parallel work track focusing on specific project aspect
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    lead: Optional[str] = Field(default=None, description="""Work stream lead""", json_schema_extra = { "linkml_meta": {'alias': 'lead', 'domain_of': ['WorkStream']} })
-    team: Optional[str] = Field(default=None, description="""Assigned project team""", json_schema_extra = { "linkml_meta": {'alias': 'team', 'domain_of': ['Project', 'WorkStream']} })
-    deliverables: Optional[list[str]] = Field(default=None, description="""Associated deliverables""", json_schema_extra = { "linkml_meta": {'alias': 'deliverables', 'domain_of': ['Milestone', 'Phase', 'WorkStream']} })
-    dependencies: Optional[list[str]] = Field(default=None, description="""Dependencies""", json_schema_extra = { "linkml_meta": {'alias': 'dependencies', 'domain_of': ['BacklogItem', 'WorkStream']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    lead: Optional[str] = Field(default=None, description="""Work stream lead""")
+    team: Optional[str] = Field(default=None, description="""Assigned project team""")
+    deliverables: OptionalDeliverables
+    dependencies: Optional[tuple[str, ...]] = Field(default=None, description="""Dependencies""")
 
 
 class Documentation(ConfiguredBaseModel):
     """
     Project artifact serving various stakeholder needs
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'status': {'name': 'status',
-                                   'range': 'AgileArtifactStatusEnum'},
-                        'type': {'name': 'type', 'range': 'DocumentationTypeEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    title: str = Field(default=..., description="""Short descriptive title""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'title', 'domain_of': ['UserStory', 'Issue', 'Documentation']} })
-    content: Optional[str] = Field(default=None, description="""Content""", json_schema_extra = { "linkml_meta": {'alias': 'content', 'domain_of': ['Documentation']} })
-    type: Optional[DocumentationTypeEnum] = Field(default=None, description="""Type classification""", json_schema_extra = { "linkml_meta": {'alias': 'type',
-         'domain_of': ['Issue',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Documentation',
-                       'Repository']} })
-    status: Optional[AgileArtifactStatusEnum] = Field(default=None, description="""Current status""", json_schema_extra = { "linkml_meta": {'alias': 'status',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Phase',
-                       'Documentation']} })
-    owner: Optional[str] = Field(default=None, description="""Owner""", json_schema_extra = { "linkml_meta": {'alias': 'owner', 'domain_of': ['Risk', 'Documentation', 'CommunicationPlan']} })
-    created_date: Optional[str] = Field(default=None, description="""Creation timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'created_date',
-         'domain_of': ['Project', 'Requirement', 'Epic', 'Issue', 'Documentation']} })
-    last_updated: Optional[str] = Field(default=None, description="""Last update timestamp""", json_schema_extra = { "linkml_meta": {'alias': 'last_updated',
-         'domain_of': ['Project', 'Requirement', 'Documentation']} })
-    version: Optional[str] = Field(default=None, description="""Version""", json_schema_extra = { "linkml_meta": {'alias': 'version', 'domain_of': ['Deliverable', 'Baseline', 'Documentation']} })
-    audience: Optional[str] = Field(default=None, description="""Target audience""", json_schema_extra = { "linkml_meta": {'alias': 'audience', 'domain_of': ['Documentation', 'CommunicationPlan']} })
+    __slots__ = ()
+
+    id: Identifier
+    title: Title
+    content: Optional[str] = Field(default=None, description="""Content""")
+    type: Optional[DocumentationTypeEnum] = Field(default=None, description="""Type classification""")
+    status: Optional[AgileArtifactStatusEnum] = Field(default=None, description="""Current status""")
+    owner: OptionalOwner
+    created_date: OptionalCreatedDate
+    last_updated: OptionalLastUpdated
+    version: OptionalVersion
+    audience: Optional[str] = Field(default=None, description="""Target audience""")
 
 
 class Repository(ConfiguredBaseModel):
     """
     Storage location for project artifacts and code
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'type': {'name': 'type', 'range': 'RepositoryTypeEnum'}}})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    type: Optional[RepositoryTypeEnum] = Field(default=None, description="""Type classification""", json_schema_extra = { "linkml_meta": {'alias': 'type',
-         'domain_of': ['Issue',
-                       'ChangeRequest',
-                       'TestCase',
-                       'Documentation',
-                       'Repository']} })
-    url: Optional[str] = Field(default=None, description="""URL""", json_schema_extra = { "linkml_meta": {'alias': 'url', 'domain_of': ['Repository']} })
-    access_controls: Optional[str] = Field(default=None, description="""Access controls""", json_schema_extra = { "linkml_meta": {'alias': 'access_controls', 'domain_of': ['Repository']} })
-    last_sync_date: Optional[str] = Field(default=None, description="""Last sync date""", json_schema_extra = { "linkml_meta": {'alias': 'last_sync_date', 'domain_of': ['Repository']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    type: Optional[RepositoryTypeEnum] = Field(default=None, description="""Type classification""")
+    url: Optional[str] = Field(default=None, description="""URL""")
+    access_controls: Optional[str] = Field(default=None, description="""Access controls""")
+    last_sync_date: Optional[date] = Field(default=None, description="""Last sync date""")
 
 
 class Metric(ConfiguredBaseModel):
     """
     Quantitative measure of project performance or quality
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    value: Optional[float] = Field(default=None, description="""Metric value""", json_schema_extra = { "linkml_meta": {'alias': 'value', 'domain_of': ['Metric']} })
-    target: Optional[float] = Field(default=None, description="""Target value""", json_schema_extra = { "linkml_meta": {'alias': 'target', 'domain_of': ['Metric']} })
-    unit: Optional[str] = Field(default=None, description="""Measurement unit""", json_schema_extra = { "linkml_meta": {'alias': 'unit', 'domain_of': ['Metric']} })
-    measurement_date: Optional[str] = Field(default=None, description="""Measurement date""", json_schema_extra = { "linkml_meta": {'alias': 'measurement_date', 'domain_of': ['Metric']} })
-    trend: Optional[str] = Field(default=None, description="""Trend""", json_schema_extra = { "linkml_meta": {'alias': 'trend', 'domain_of': ['Metric']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    value: Optional[float] = Field(default=None, description="""Metric value""")
+    target: Optional[float] = Field(default=None, description="""Target value""")
+    unit: Optional[str] = Field(default=None, description="""Measurement unit""")
+    measurement_date: Optional[date] = Field(default=None, description="""Measurement date""")
+    trend: Optional[str] = Field(default=None, description="""Trend""")
 
 
 class Person(ConfiguredBaseModel):
     """
     Human individual involved in the project environment
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'class_uri': 'schema:Person',
-         'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    person_name: str = Field(default=..., description="""Person's name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'person_name', 'domain_of': ['Person']} })
-    email: Optional[str] = Field(default=None, description="""Contact email""", json_schema_extra = { "linkml_meta": {'alias': 'email', 'domain_of': ['Person']} })
-    communication_preferences: Optional[str] = Field(default=None, description="""Communication preferences""", json_schema_extra = { "linkml_meta": {'alias': 'communication_preferences', 'domain_of': ['Stakeholder', 'Person']} })
+    __slots__ = ()
+
+    id: Identifier
+    person_name: PersonName
+    email: OptionalEmail
+    communication_preferences: OptionalCommunicationPreferences
 
 
 class TeamMember(Person):
     """
     Individual team member with role responsibilities and capacity
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management',
-         'slot_usage': {'role': {'name': 'role',
-                                 'range': 'RoleEnum',
-                                 'required': True}}})
-
-    role: RoleEnum = Field(default=..., description="""Primary role""", json_schema_extra = { "linkml_meta": {'alias': 'role', 'domain_of': ['TeamMember', 'Stakeholder', 'UserProfiler']} })
-    capacity: Optional[float] = Field(default=None, description="""Weekly capacity in hours""", ge=0, json_schema_extra = { "linkml_meta": {'alias': 'capacity', 'domain_of': ['Team', 'TeamMember']} })
-    is_active: Optional[bool] = Field(default=True, description="""Active status""", json_schema_extra = { "linkml_meta": {'alias': 'is_active', 'domain_of': ['TeamMember'], 'ifabsent': 'boolean(true)'} })
-    skills: Optional[list[str]] = Field(default=None, description="""Skills""", json_schema_extra = { "linkml_meta": {'alias': 'skills', 'domain_of': ['TeamMember', 'UserProfiler']} })
-    start_date: Optional[str] = Field(default=None, description="""Start date""", json_schema_extra = { "linkml_meta": {'alias': 'start_date', 'domain_of': ['Sprint', 'TeamMember', 'Phase']} })
-    end_date: Optional[str] = Field(default=None, description="""End date""", json_schema_extra = { "linkml_meta": {'alias': 'end_date', 'domain_of': ['Sprint', 'TeamMember', 'Phase']} })
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    person_name: str = Field(default=..., description="""Person's name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'person_name', 'domain_of': ['Person']} })
-    email: Optional[str] = Field(default=None, description="""Contact email""", json_schema_extra = { "linkml_meta": {'alias': 'email', 'domain_of': ['Person']} })
-    communication_preferences: Optional[str] = Field(default=None, description="""Communication preferences""", json_schema_extra = { "linkml_meta": {'alias': 'communication_preferences', 'domain_of': ['Stakeholder', 'Person']} })
+    __slots__ = ()
+
+    role: RoleEnum = Field(default=..., description="""Primary role""")
+    capacity: Optional[float] = Field(default=None, description="""Weekly capacity in hours""", ge=0)
+    is_active: Optional[bool] = Field(default=True, description="""Active status""")
+    skills: Optional[list[str]] = Field(default=None, description="""Skills""")
+    start_date: OptionalStartDate
+    end_date: OptionalEndDate
 
 
 class Stakeholder(Person):
     """
     Project stakeholder with influence and interest assessment
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    role: Optional[RoleEnum] = Field(default=None, description="""Primary role""", json_schema_extra = { "linkml_meta": {'alias': 'role', 'domain_of': ['TeamMember', 'Stakeholder', 'UserProfiler']} })
-    influence: Optional[InfluenceLevelEnum] = Field(default=None, description="""Influence level""", json_schema_extra = { "linkml_meta": {'alias': 'influence', 'domain_of': ['Stakeholder']} })
-    interest: Optional[InterestLevelEnum] = Field(default=None, description="""Interest level""", json_schema_extra = { "linkml_meta": {'alias': 'interest', 'domain_of': ['Stakeholder']} })
-    communication_preferences: Optional[str] = Field(default=None, description="""Communication preferences""", json_schema_extra = { "linkml_meta": {'alias': 'communication_preferences', 'domain_of': ['Stakeholder', 'Person']} })
-    engagement_plan: Optional[str] = Field(default=None, description="""Engagement plan""", json_schema_extra = { "linkml_meta": {'alias': 'engagement_plan', 'domain_of': ['Stakeholder']} })
-    concerns: Optional[list[str]] = Field(default=None, description="""Concerns""", json_schema_extra = { "linkml_meta": {'alias': 'concerns', 'domain_of': ['Stakeholder']} })
-    expectations: Optional[list[str]] = Field(default=None, description="""Expectations""", json_schema_extra = { "linkml_meta": {'alias': 'expectations', 'domain_of': ['Stakeholder', 'UserProfiler']} })
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    person_name: str = Field(default=..., description="""Person's name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'person_name', 'domain_of': ['Person']} })
-    email: Optional[str] = Field(default=None, description="""Contact email""", json_schema_extra = { "linkml_meta": {'alias': 'email', 'domain_of': ['Person']} })
+    __slots__ = ()
+
+    role: Optional[RoleEnum] = Field(default=None, description="""Primary role""")
+    influence: Optional[InfluenceLevelEnum] = Field(default=None, description="""Influence level""")
+    interest: Optional[InterestLevelEnum] = Field(default=None, description="""Interest level""")
+    engagement_plan: Optional[str] = Field(default=None, description="""Engagement plan""")
+    concerns: Optional[list[str]] = Field(default=None, description="""Concerns""")
+    expectations: Optional[list[str]] = Field(default=None, description="""Expectations""")
 
 
 class UserProfiler(Person):
     """
     Represents a user's profile, including their skills, experience, and expectations.
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    role: Optional[RoleEnum] = Field(default=None, description="""Primary role""", json_schema_extra = { "linkml_meta": {'alias': 'role', 'domain_of': ['TeamMember', 'Stakeholder', 'UserProfiler']} })
-    experience: Optional[ExperienceLevelEnum] = Field(default=None, description="""User's experience level""", json_schema_extra = { "linkml_meta": {'alias': 'experience', 'domain_of': ['UserProfiler']} })
-    skills: Optional[list[str]] = Field(default=None, description="""Skills""", json_schema_extra = { "linkml_meta": {'alias': 'skills', 'domain_of': ['TeamMember', 'UserProfiler']} })
-    expectations: Optional[list[str]] = Field(default=None, description="""Expectations""", json_schema_extra = { "linkml_meta": {'alias': 'expectations', 'domain_of': ['Stakeholder', 'UserProfiler']} })
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    person_name: str = Field(default=..., description="""Person's name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'person_name', 'domain_of': ['Person']} })
-    email: Optional[str] = Field(default=None, description="""Contact email""", json_schema_extra = { "linkml_meta": {'alias': 'email', 'domain_of': ['Person']} })
-    communication_preferences: Optional[str] = Field(default=None, description="""Communication preferences""", json_schema_extra = { "linkml_meta": {'alias': 'communication_preferences', 'domain_of': ['Stakeholder', 'Person']} })
+    __slots__ = ()
+
+    role: Optional[RoleEnum] = Field(default=None, description="""Primary role""")
+    experience: Optional[ExperienceLevelEnum] = Field(default=None, description="""User's experience level""")
+    skills: Optional[list[str]] = Field(default=None, description="""Skills""")
+    expectations: Optional[list[str]] = Field(default=None, description="""Expectations""")
 
 
 class CommunicationPlan(ConfiguredBaseModel):
     """
     Structured approach to project information distribution
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    purpose: Optional[str] = Field(default=None, description="""Purpose of the communication plan""", json_schema_extra = { "linkml_meta": {'alias': 'purpose', 'domain_of': ['CommunicationPlan']} })
-    audience: Optional[str] = Field(default=None, description="""Target audience""", json_schema_extra = { "linkml_meta": {'alias': 'audience', 'domain_of': ['Documentation', 'CommunicationPlan']} })
-    message: Optional[str] = Field(default=None, description="""Message content for communication""", json_schema_extra = { "linkml_meta": {'alias': 'message', 'domain_of': ['CommunicationPlan']} })
-    frequency: Optional[str] = Field(default=None, description="""Frequency of communication""", json_schema_extra = { "linkml_meta": {'alias': 'frequency', 'domain_of': ['CommunicationPlan']} })
-    channel: Optional[str] = Field(default=None, description="""Communication channel""", json_schema_extra = { "linkml_meta": {'alias': 'channel', 'domain_of': ['CommunicationPlan']} })
-    owner: Optional[str] = Field(default=None, description="""Owner""", json_schema_extra = { "linkml_meta": {'alias': 'owner', 'domain_of': ['Risk', 'Documentation', 'CommunicationPlan']} })
-    feedback_mechanism: Optional[str] = Field(default=None, description="""Feedback mechanism for communication""", json_schema_extra = { "linkml_meta": {'alias': 'feedback_mechanism', 'domain_of': ['CommunicationPlan']} })
+    __slots__ = ()
+
+    id: Identifier
+    purpose: Optional[str] = Field(default=None, description="""Purpose of the communication plan""")
+    audience: Optional[str] = Field(default=None, description="""Target audience""")
+    message: Optional[str] = Field(default=None, description="""Message content for communication""")
+    frequency: Optional[str] = Field(default=None, description="""Frequency of communication""")
+    channel: Optional[str] = Field(default=None, description="""Communication channel""")
+    owner: OptionalOwner
+    feedback_mechanism: Optional[str] = Field(default=None, description="""Feedback mechanism for communication""")
 
 
 class AIWorkProduct(ConfiguredBaseModel):
     """
     AI-generated artifacts and their provenance information
     """
-    linkml_meta: ClassVar[LinkMLMeta] = LinkMLMeta({'from_schema': 'https://example.org/software_project_management'})
-
-    id: str = Field(default=..., description="""Unique identifier""", json_schema_extra = { "linkml_meta": {'alias': 'id',
-         'domain_of': ['Project',
-                       'BusinessCase',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Sprint',
-                       'Issue',
-                       'Team',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Documentation',
-                       'Repository',
-                       'Metric',
-                       'Person',
-                       'CommunicationPlan',
-                       'AIWorkProduct']} })
-    name: str = Field(default=..., description="""Name""", ge=1, le=100, json_schema_extra = { "linkml_meta": {'alias': 'name',
-         'domain_of': ['Project',
-                       'Epic',
-                       'Backlog',
-                       'Sprint',
-                       'Team',
-                       'Milestone',
-                       'Deliverable',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Repository',
-                       'Metric',
-                       'AIWorkProduct']} })
-    description: Optional[str] = Field(default=None, description="""Detailed description""", json_schema_extra = { "linkml_meta": {'alias': 'description',
-         'domain_of': ['Project',
-                       'Requirement',
-                       'Epic',
-                       'UserStory',
-                       'Backlog',
-                       'BacklogItem',
-                       'Issue',
-                       'Risk',
-                       'Milestone',
-                       'Deliverable',
-                       'ChangeRequest',
-                       'Baseline',
-                       'TestCase',
-                       'Phase',
-                       'WorkStream',
-                       'Metric',
-                       'AIWorkProduct']} })
-    generated_by: Optional[str] = Field(default=None, description="""Generated by""", json_schema_extra = { "linkml_meta": {'alias': 'generated_by', 'domain_of': ['AIWorkProduct']} })
-    generation_date: Optional[str] = Field(default=None, description="""Generation date""", json_schema_extra = { "linkml_meta": {'alias': 'generation_date', 'domain_of': ['AIWorkProduct']} })
-    input_parameters: Optional[str] = Field(default=None, description="""Input parameters""", json_schema_extra = { "linkml_meta": {'alias': 'input_parameters', 'domain_of': ['AIWorkProduct']} })
-    confidence_score: Optional[float] = Field(default=None, description="""Confidence score""", ge=0, le=1, json_schema_extra = { "linkml_meta": {'alias': 'confidence_score', 'domain_of': ['AIWorkProduct']} })
-    validation_status: Optional[ApprovalStatusEnum] = Field(default=None, description="""Validation status""", json_schema_extra = { "linkml_meta": {'alias': 'validation_status', 'domain_of': ['AIWorkProduct']} })
-    associated_requirement: Optional[str] = Field(default=None, description="""Associated requirement""", json_schema_extra = { "linkml_meta": {'alias': 'associated_requirement', 'domain_of': ['TestCase', 'AIWorkProduct']} })
+    __slots__ = ()
+
+    id: Identifier
+    name: Name
+    description: OptionalDescription
+    generated_by: Optional[str] = Field(default=None, description="""Generated by""")
+    generation_date: Optional[date] = Field(default=None, description="""Generation date""")
+    input_parameters: Optional[str] = Field(default=None, description="""Input parameters""")
+    confidence_score: Optional[float] = Field(default=None, description="""Confidence score""", ge=0, le=1)
+    validation_status: Optional[ApprovalStatusEnum] = Field(default=None, description="""Validation status""")
+    associated_requirement: Optional[str] = Field(default=None, description="""Associated requirement""")
 
 
 # Model rebuild
+# Validators and serializers are built lazily on first use (defer_build=True);
+# call warmup() to build them ahead of time, e.g. from application startup.
 # see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-Project.model_rebuild()
-BusinessCase.model_rebuild()
-Scope.model_rebuild()
-Requirement.model_rebuild()
-Epic.model_rebuild()
-UserStory.model_rebuild()
-Backlog.model_rebuild()
-BacklogItem.model_rebuild()
-Sprint.model_rebuild()
-Issue.model_rebuild()
-Team.model_rebuild()
-Risk.model_rebuild()
-Milestone.model_rebuild()
-Deliverable.model_rebuild()
-ChangeRequest.model_rebuild()
-Baseline.model_rebuild()
-TestCase.model_rebuild()
-Phase.model_rebuild()
-WorkStream.model_rebuild()
-Documentation.model_rebuild()
-Repository.model_rebuild()
-Metric.model_rebuild()
-Person.model_rebuild()
-TeamMember.model_rebuild()
-Stakeholder.model_rebuild()
-UserProfiler.model_rebuild()
-CommunicationPlan.model_rebuild()
-AIWorkProduct.model_rebuild()
+_ALL_MODELS = (
+    Project,
+    BusinessCase,
+    Scope,
+    Requirement,
+    Epic,
+    UserStory,
+    Backlog,
+    BacklogItem,
+    Sprint,
+    Issue,
+    Team,
+    Risk,
+    Milestone,
+    Deliverable,
+    ChangeRequest,
+    Baseline,
+    TestCase,
+    Phase,
+    WorkStream,
+    Documentation,
+    Repository,
+    Metric,
+    Person,
+    TeamMember,
+    Stakeholder,
+    UserProfiler,
+    CommunicationPlan,
+    AIWorkProduct,
+)
+
 
+def warmup(classes: Optional[Iterable[type[ConfiguredBaseModel]]] = None) -> None:
+    """
+    Build the core schema, validator and serializer of deferred models.
+
+    Args:
+        classes: Models to build; defaults to every model in this module
+    """
+    for cls in classes or _ALL_MODELS:
+        cls.model_rebuild()
@@ -0,0 +1,68 @@
+"""
+Plain slotted dataclass mirrors of the data models.
+
+Internal code that builds or walks many records (planning, aggregation) does
+not need validation on every construction. ``dataclass_for`` derives a
+``@dataclass(slots=True)`` class with the same field names and defaults from a
+model, so such code can work on light records and convert back to the Pydantic
+model only at the API boundary.
+"""
+
+from dataclasses import field, fields, make_dataclass
+from functools import cache
+from typing import Any, Type
+
+from .data_models import ConfiguredBaseModel
+
+
+@cache
+def dataclass_for(model: Type[ConfiguredBaseModel]) -> type:
+    """
+    Build the slotted dataclass mirroring a model's fields.
+
+    Args:
+        model: The model class to mirror
+
+    Returns:
+        type: A dataclass named ``<Model>Record``; required fields come first
+    """
+    # Resolves forward references left in the field annotations of deferred models
+    model.model_rebuild()
+    required, optional = [], []
+    for name, info in model.model_fields.items():
+        if info.is_required():
+            required.append((name, info.annotation))
+        else:
+            optional.append((name, info.annotation, field(default=info.default)))
+    return make_dataclass(f"{model.__name__}Record", required + optional, slots=True)
+
+
+def to_dataclass(record: ConfiguredBaseModel) -> Any:
+    """
+    Copy a validated record into its dataclass mirror.
+
+    Args:
+        record: The model instance
+
+    Returns:
+        Any: An instance of ``dataclass_for(type(record))``
+    """
+    return dataclass_for(type(record))(**record.__dict__)
+
+
+def from_dataclass(model: Type[ConfiguredBaseModel], obj: Any, validate: bool = True) -> ConfiguredBaseModel:
+    """
+    Convert a dataclass mirror back into its model.
+
+    Args:
+        model: The model class to build
+        obj: An instance of ``dataclass_for(model)``
+        validate: Validate the values; pass False only if they came from validated records
+
+    Returns:
+        ConfiguredBaseModel: The model instance
+    """
+    data = {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if validate:
+        return model.model_validate(data)
+    return model.from_trusted(**data)
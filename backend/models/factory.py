@@ -1,33 +1,52 @@
-import json
+import threading
+from functools import cache
+from typing import List, Union
+
+import orjson
+from pydantic import TypeAdapter
+
 from .data_models import Project
 from config.settings import get_config_manager
 
+@cache
 def project_to_json_schema() -> dict:
     """
     Convert the Project class to its JSON schema representation.
 
+    The schema is generated once and shared between callers, who must not
+    mutate it.
+
     Returns:
         dict: The JSON schema of the Project class.
     """
     return Project.model_json_schema()
 
+
+@cache
+def _project_list_adapter() -> TypeAdapter:
+    # Built on first use so that importing this module does not force the
+    # deferred Project schema build
+    return TypeAdapter(List[Project])
+
     # INSERT_YOUR_CODE
 class ProjectFactory:
     """
     Singleton factory class for creating and managing Project instances.
     """
     _instance = None
-    
-    def __init__(self):
-        
-        config_manager = get_config_manager("../config/config.json")
-
-        with open(config_manager.system.data_model_file, 'r', encoding='utf-8') as f:
-            self._project_schema = f.read()
+    _lock = threading.Lock()
 
     def __new__(cls):
+        # The instance is set up here rather than in __init__, which Python
+        # would run again on every ProjectFactory() call
         if cls._instance is None:
-            cls._instance = super(ProjectFactory, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(ProjectFactory, cls).__new__(cls)
+                    config_manager = get_config_manager("../config/config.json")
+                    with open(config_manager.system.data_model_file, 'rb') as f:
+                        instance._project_schema = orjson.loads(f.read())
+                    cls._instance = instance
         return cls._instance
 
     def create_project(self, **kwargs):
@@ -39,10 +58,41 @@ class ProjectFactory:
         """
         return Project(**kwargs)
 
+    def load_project_json(self, raw: Union[bytes, str]) -> Project:
+        """
+        Validate a JSON document straight into a Project instance.
+
+        The JSON is parsed and validated in a single pydantic-core pass,
+        without building an intermediate dict as ``Project(**json.loads(raw))``
+        would.
+
+        Args:
+            raw: The JSON document
+
+        Returns:
+            Project: The validated Project instance.
+        """
+        return Project.model_validate_json(raw)
+
+    def load_projects_json(self, raw: Union[bytes, str]) -> List[Project]:
+        """
+        Validate a JSON array straight into a list of Project instances.
+
+        Args:
+            raw: The JSON array
+
+        Returns:
+            List[Project]: The validated Project instances.
+        """
+        return _project_list_adapter().validate_json(raw)
+
     def get_project_schema(self) -> dict:
         """
         Get the JSON schema of the Project class.
 
+        The schema is parsed once from the data model file and shared between
+        callers, who must not mutate it.
+
         Returns:
             dict: The JSON schema of the Project class.
         """
@@ -0,0 +1,90 @@
+"""
+Fast JSON serialization helpers for the data models.
+
+Records are validated when they are built, so writing them out does not need
+to go through the model serializer again. These helpers hand the field
+dictionaries straight to orjson, which encodes strings, enums, dates and
+nested containers natively.
+
+For the read side, ``bulk_validate_json`` validates a JSON array of records
+into plain dictionaries in a single pydantic-core pass, without constructing
+one model instance per record.
+"""
+
+from functools import cache
+from typing import Annotated, Any, Dict, Iterable, List, Type, Union
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for values it cannot encode natively (nested models)."""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json_bulk(items: Iterable[BaseModel]) -> bytes:
+    """
+    Serialize a collection of validated models to a JSON array.
+
+    Args:
+        items: The models to serialize
+
+    Returns:
+        bytes: The UTF-8 encoded JSON array
+    """
+    # OPT_UTC_Z writes UTC datetimes with a "Z" suffix, as model_dump_json does
+    return orjson.dumps([item.__dict__ for item in items], default=_default, option=orjson.OPT_UTC_Z)
+
+
+@cache
+def record_dict_type(model: Type[BaseModel]) -> type:
+    """
+    Build a TypedDict mirroring the fields, constraints and config of a model.
+
+    Args:
+        model: The model class to mirror
+
+    Returns:
+        type: A TypedDict whose optional fields may be absent
+    """
+    # Resolves forward references left in the field annotations of deferred models
+    model.model_rebuild()
+    fields = {}
+    for name, info in model.model_fields.items():
+        annotation = Annotated[(info.annotation, *info.metadata)] if info.metadata else info.annotation
+        fields[name] = annotation if info.is_required() else NotRequired[annotation]
+    record_dict = TypedDict(f"{model.__name__}Dict", fields)
+    record_dict.__pydantic_config__ = {
+        key: model.model_config[key]
+        for key in ('extra', 'use_enum_values', 'strict')
+        if key in model.model_config
+    }
+    return record_dict
+
+
+@cache
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[record_dict_type(model)])
+
+
+def bulk_validate_json(model: Type[BaseModel], raw: Union[bytes, str]) -> List[Dict[str, Any]]:
+    """
+    Validate a JSON array of records against a model, returning dictionaries.
+
+    Each record gets the same type and constraint checks as ``model`` but stays
+    a plain dict; optional fields missing from the input are left out rather
+    than filled with their defaults. Field validators of the model are not run,
+    and nested model fields (``Project.scope``) still become model instances.
+
+    Args:
+        model: The model class describing each record
+        raw: The JSON array to validate
+
+    Returns:
+        List[Dict[str, Any]]: The validated records
+    """
+    return _list_adapter(model).validate_json(raw)
@@ -1,21 +1,19 @@
 import asyncio
-import uuid
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
-from autogen_core import SingleThreadedAgentRuntime, TopicId, MessageContext, TypeSubscription
-import json
+from secrets import token_hex
+from fastapi import FastAPI, WebSocket
+from autogen_core import SingleThreadedAgentRuntime, TopicId
 from config.logging_config import setup_logging, get_logger
-from base.utils import configure_oltp_tracing
-from base.model_client import create_model_client
 from agents.factory import AgentFactory
-from agents.tools import USER_TOPIC_TYPE, TRIAGE_AGENT_TOPIC_TYPE
-from base.messaging import UserLogin, UserTask, AgentResponse
+from agents.tools import USER_TOPIC_TYPE
+from base.messaging import UserLogin
 from config.settings import get_config_manager
-from models.data_models import Project
-from autogen_core.models import UserMessage, ChatCompletionClient
+from models.data_models import Project, UserProfiler, warmup
+from autogen_core.models import ChatCompletionClient
 from fastapi.middleware.cors import CORSMiddleware
 
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+
+logger = get_logger(__name__)
 
 
 class UserSession:
@@ -24,12 +22,13 @@ class UserSession:
         self.runtime = SingleThreadedAgentRuntime(tracer_provider=tracer_provider)
         self.agent_factory = AgentFactory(self.runtime, model_client)
         self.input_queue = self.agent_factory.input_queue
-        self.response_queue = self.agent_factory.response_queue
+        self.started = False
 
     async def initialize(self):
         await self.agent_factory.register_all_agents()
         await self.agent_factory.add_all_subscriptions()
         self.runtime.start()
+        self.started = True
         
         await self.runtime.publish_message(
         UserLogin(), 
@@ -37,20 +36,60 @@ class UserSession:
     )
 
     async def close(self):
-        await self.runtime.stop()
+        # A session whose build was cancelled or failed may never have started its runtime
+        if self.started:
+            self.started = False
+            await self.runtime.stop()
 
 class UserSessionManager:
-    def __init__(self, model_client: ChatCompletionClient, tracer_provider):
+    def __init__(self, model_client: ChatCompletionClient, tracer_provider, pool_size: int = 0):
         self.sessions = {}
         self.model_client = model_client
         self.tracer_provider = tracer_provider
+        # Sessions are built ahead of time, each with its own runtime and id,
+        # and handed out once; they are never reused after being closed
+        self.pool_size = pool_size
+        self.pool: asyncio.Queue = asyncio.Queue()
+        self._refill_task = None
+
+    async def _build_session(self) -> UserSession:
+        session = UserSession(token_hex(16), self.model_client, self.tracer_provider)
+        try:
+            await session.initialize()
+        except BaseException:
+            # A build cancelled or failed after runtime.start() leaves the
+            # runtime running; the session never reaches the pool or
+            # self.sessions, so nothing else would stop it
+            await session.close()
+            raise
+        return session
+
+    async def fill_pool(self):
+        """Build sessions until the pool holds pool_size of them."""
+        while self.pool.qsize() < self.pool_size:
+            self.pool.put_nowait(await self._build_session())
+
+    def schedule_fill(self):
+        """Start filling the pool in the background unless a fill is already running."""
+        if self.pool_size and (self._refill_task is None or self._refill_task.done()):
+            self._refill_task = asyncio.create_task(self.fill_pool())
+            self._refill_task.add_done_callback(self._log_fill_failure)
+
+    @staticmethod
+    def _log_fill_failure(task: asyncio.Task):
+        # Nothing awaits the fill task before shutdown, so a failed build would
+        # otherwise only surface when the task is garbage-collected
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Filling the session pool failed", exc_info=task.exception())
 
     async def create_session(self) -> str:
-        session_id = str(uuid.uuid4())
-        session = UserSession(session_id, self.model_client, self.tracer_provider)
-        await session.initialize()
-        self.sessions[session_id] = session
-        return session_id
+        try:
+            session = self.pool.get_nowait()
+        except asyncio.QueueEmpty:
+            session = await self._build_session()
+        self.schedule_fill()
+        self.sessions[session.session_id] = session
+        return session.session_id
 
     def get_session(self, session_id: str) -> UserSession:
         return self.sessions.get(session_id)
@@ -60,6 +99,20 @@ class UserSessionManager:
         if session:
             await session.close()
 
+    async def close_pool(self):
+        """Stop refilling the pool and close every session, pooled or handed out."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            # Wait for the refill to close the session it was building; a failed
+            # refill was logged by _log_fill_failure and must not stop shutdown
+            with suppress(asyncio.CancelledError, Exception):
+                await self._refill_task
+            self._refill_task = None
+        while not self.pool.empty():
+            await self.pool.get_nowait().close()
+        for session_id in list(self.sessions):
+            await self.close_session(session_id)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -79,6 +132,11 @@ async def lifespan(app: FastAPI):
     logger = get_logger(__name__)
     logger.info("Starting handoffs pattern system")
 
+    # Tracing and the model client are only needed once the app starts, so
+    # importing this module does not pull in the exporter and LLM client stacks
+    from base.utils import configure_oltp_tracing
+    from base.model_client import create_model_client
+
     # Configure tracing based on configuration
     if config_manager.runtime.enable_tracing:
         tracing_endpoint = config_manager.runtime.tracing_endpoint
@@ -91,11 +149,22 @@ async def lifespan(app: FastAPI):
     model_client = create_model_client(config_manager=config_manager)
 
     # Create the user session manager
-    user_session_manager = UserSessionManager(model_client, tracer_provider)
+    user_session_manager = UserSessionManager(
+        model_client,
+        tracer_provider,
+        pool_size=config_manager.runtime.session_pool_size
+    )
+
+    # Build the validators of the models the agents use before the first session
+    warmup((Project, UserProfiler))
+    # Serving starts right away; sessions requested before the pool is
+    # filled are built on demand
+    user_session_manager.schedule_fill()
 
     yield
     
     # Shutdown logic
+    await user_session_manager.close_pool()
     if model_client:
         await model_client.close()
 
@@ -128,32 +197,19 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
 
     logger.info(f"Runtime for session {session_id}: {session.runtime}")
 
-    # Task to send agent responses to the client
-    async def send_responses():
-        while True:
-            response = await session.response_queue.get()
-            if response is None:
-                break
-            if response.context and len(response.context) > 0:
-                import json
-                agent_reply = json.dumps(response.context[-1].model_dump())
-                logger.info(f"Sending agent reply to client: {agent_reply}")
-                await websocket.send_text(agent_reply)
-
-    send_task = asyncio.create_task(send_responses())
+    # Agent replies are pushed straight to the client as they are produced
+    session.agent_factory.register_sink(websocket.send_text)
 
     try:
-        while True:
-            data = await websocket.receive_text()
-            await session.input_queue.put(data)
-            logger.info(f"Received message from {session_id}: {data}")
+        # iter_text() ends when the client disconnects
+        async for data in websocket.iter_text():
+            session.input_queue.put_nowait(data)
+            logger.info("Received message from %s: %s", session_id, data)
 
-    except WebSocketDisconnect:
         logger.info(f"Client disconnected: {session_id}")
     finally:
         logger.info(f"Closing connection for {session_id}")
-        await session.response_queue.put(None)
-        send_task.cancel()
+        session.agent_factory.register_sink(None)
         await user_session_manager.close_session(session_id)
 
 
@@ -163,8 +219,14 @@ if __name__ == "__main__":
     config_manager = get_config_manager("../config/config.json")
     server_settings = config_manager.server
     
+    # Sessions live in this process, so the server runs a single worker;
+    # the default "auto" loop and http settings pick uvloop and httptools
+    # from uvicorn[standard] when they are available
     uvicorn.run(
         app, 
         host=server_settings.host, 
-        port=server_settings.port
+        port=server_settings.port,
+        access_log=server_settings.access_log,
+        # Chat replies are small; compressing each frame costs more than it saves
+        ws_per_message_deflate=False,
     )
\ No newline at end of file
@@ -0,0 +1,51 @@
+import logging
+
+from agents.factory import AgentFactory
+
+
+def make_factory():
+    return AgentFactory(runtime=None, model_client=None)
+
+
+async def test_replies_are_pushed_to_the_registered_sink():
+    factory = make_factory()
+    sent = []
+
+    async def sink(text):
+        sent.append(text)
+
+    factory.register_sink(sink)
+    await factory._send_response('{"content": "hello"}')
+    await factory._send_response('{"content": "again"}')
+
+    assert sent == ['{"content": "hello"}', '{"content": "again"}']
+
+
+async def test_reply_without_sink_is_dropped_with_a_warning(caplog):
+    factory = make_factory()
+    sent = []
+
+    async def sink(text):
+        sent.append(text)
+
+    factory.register_sink(sink)
+    factory.register_sink(None)
+    with caplog.at_level(logging.WARNING, logger="agents.factory"):
+        await factory._send_response('{"content": "lost"}')
+
+    assert sent == []
+    assert "dropping agent reply" in caplog.text
+
+
+async def test_sink_failure_does_not_reach_the_runtime(caplog):
+    factory = make_factory()
+
+    async def closed_socket(text):
+        raise RuntimeError("Cannot call send once a close message has been sent.")
+
+    factory.register_sink(closed_socket)
+    with caplog.at_level(logging.WARNING, logger="agents.factory"):
+        await factory._send_response('{"content": "late"}')
+
+    assert "Failed to deliver agent reply" in caplog.text
+    assert "RuntimeError" in caplog.text
@@ -0,0 +1,118 @@
+import pytest
+
+from models.columns import MISSING_CODE, TagColumn, from_columns, to_columns
+from models.data_models import BacklogItem, Issue, TeamMember
+
+
+@pytest.fixture
+def issues():
+    return [
+        Issue(id="i1", title="Crash on save", type="Bug", status="Done", severity="High", created_date="2024-01-01T09:30:00"),
+        Issue(id="i2", title="Add export", type="Task", status="In Progress", severity="Low", assignee="ana"),
+        Issue(id="i3", title="Slow search", type="Bug", severity="High"),
+    ]
+
+
+def test_to_columns_encodes_enum_fields_as_codes(issues):
+    columns = to_columns(issues)
+
+    assert len(columns) == 3
+    assert columns.ids == ["i1", "i2", "i3"]
+    assert list(columns.enums) == ["type", "status", "severity"]
+    assert columns.enums["type"].decode(1) == "Task"
+    assert columns.enums["status"].codes[2] == MISSING_CODE
+    assert columns.enums["status"].decode(2) is None
+    assert columns.fields["assignee"] == [None, "ana", None]
+
+
+def test_from_columns_round_trips_every_row(issues):
+    columns = to_columns(issues)
+
+    assert [from_columns(columns, index) for index in range(len(columns))] == issues
+
+
+def test_from_columns_keeps_none_over_non_none_defaults():
+    rows = [
+        TeamMember(id="t1", person_name="A", role="Developer", is_active=None, capacity=0.5),
+        TeamMember(id="t2", person_name="B", role="Developer", is_active=False),
+        TeamMember(id="t3", person_name="C", role="Developer"),
+    ]
+    columns = to_columns(rows)
+    restored = [from_columns(columns, index) for index in range(len(columns))]
+
+    assert restored == rows
+    assert [member.is_active for member in restored] == [None, False, True]
+
+
+def test_counts_per_enum_value(issues):
+    columns = to_columns(issues)
+
+    assert columns.counts("type") == {"Bug": 2, "Task": 1, "Improvement": 0, "Technical Debt": 0, "Spike": 0}
+    assert columns.counts("status")["Done"] == 1
+    assert sum(columns.counts("status").values()) == 2
+    assert columns.enums["severity"].histogram() == [0, 2, 0, 1]
+
+
+def test_to_columns_needs_model_for_empty_rows():
+    with pytest.raises(ValueError):
+        to_columns([])
+
+    columns = to_columns([], model=Issue)
+    assert len(columns) == 0
+    assert columns.counts("type")["Bug"] == 0
+
+
+def test_weighted_sum_over_enum_values(issues):
+    columns = to_columns(issues)
+    weights = {"Critical": 8, "High": 5, "Medium": 3}
+
+    assert columns.weighted_sum("severity", weights) == 5 + 5
+    assert columns.weighted_sum("status", {"Done": 1.5}) == 1.5
+    assert columns.weighted_sum("type", {}) == 0
+
+
+def test_numeric_columns_skip_unset_values():
+    rows = [
+        Issue(id="i1", title="a", estimate_hours=2.5, actual_hours=0.0),
+        Issue(id="i2", title="b", estimate_hours=4.0),
+        Issue(id="i3", title="c"),
+    ]
+    columns = to_columns(rows)
+    actual = columns.numbers["actual_hours"]
+
+    assert actual.decode(0) == 0.0
+    assert actual.decode(1) is None
+    assert actual.count() == 1
+    assert columns.sum("estimate_hours") == 6.5
+    assert columns.mean("estimate_hours") == 3.25
+    assert columns.mean("actual_hours") == 0.0
+    assert to_columns(rows[2:]).mean("estimate_hours") is None
+    assert [from_columns(columns, index) for index in range(3)] == rows
+
+
+def test_tag_columns_filter_and_count_rows():
+    rows = [
+        BacklogItem(id="b1", tags=["ui", "urgent"]),
+        BacklogItem(id="b2", tags=["ui"]),
+        BacklogItem(id="b3"),
+    ]
+    columns = to_columns(rows)
+    tags = columns.tags("tags")
+
+    assert tags is columns.tags("tags")
+    assert len(tags) == 3
+    assert tags.vocabulary == {"ui": 0, "urgent": 1}
+    assert list(tags.masks) == [0b11, 0b01, 0]
+    assert tags.counts() == {"ui": 2, "urgent": 1}
+    assert columns.with_tags("tags", "ui") == [0, 1]
+    assert columns.with_tags("tags", "ui", "urgent") == [0]
+    assert columns.with_tags("tags", "unknown") == []
+    assert columns.with_tags("tags") == [0, 1, 2]
+
+
+def test_tag_columns_beyond_64_tags():
+    tags = TagColumn([[f"t{n}" for n in range(70)], ["t69"]])
+
+    assert tags.mask_of(["t69"]) == 1 << 69
+    assert tags.matching("t0", "t69") == [0]
+    assert tags.counts()["t69"] == 2
@@ -0,0 +1,53 @@
+import orjson
+
+from models.data_models import Issue, Milestone, PriorityEnum, Requirement, UserStory, UserStoryStatusEnum
+
+
+def test_literal_fields_keep_enum_definitions_in_json_schema():
+    schema = UserStory.model_json_schema()
+    status = schema["properties"]["status"]
+    assert {"$ref": "#/$defs/UserStoryStatusEnum"} in status["anyOf"]
+    assert "title" not in status
+    assert schema["$defs"]["UserStoryStatusEnum"]["description"].strip() == UserStoryStatusEnum.__doc__.strip()
+    assert schema["$defs"]["PriorityEnum"]["enum"] == [member.value for member in PriorityEnum]
+
+
+def test_literal_fields_validate_enum_values():
+    issue = Issue.model_validate({"id": "i1", "title": "Crash on save", "type": "Bug", "severity": "High"})
+    assert issue.type == "Bug"
+    assert type(issue.type) is str
+
+
+def test_created_date_is_serialized_as_datetime():
+    issue = Issue(id="i1", title="Crash on save", created_date="2024-01-01", due_date="2024-02-01")
+    data = orjson.loads(issue.model_dump_json())
+
+    assert data["created_date"] == "2024-01-01T00:00:00"
+    assert data["due_date"] == "2024-02-01"
+    assert Issue.model_validate_json(issue.model_dump_json()) == issue
+
+
+def test_created_date_json_schema_format():
+    properties = Issue.model_json_schema()["properties"]
+
+    assert {"type": "string", "format": "date-time"} in properties["created_date"]["anyOf"]
+    assert {"type": "string", "format": "date"} in properties["due_date"]["anyOf"]
+
+
+def test_last_updated_is_serialized_as_datetime():
+    requirement = Requirement(id="r1", last_updated="2024-03-01")
+    milestone = Milestone(id="m1", name="Beta", target_date="2024-06-30")
+
+    assert orjson.loads(requirement.model_dump_json())["last_updated"] == "2024-03-01T00:00:00"
+    assert orjson.loads(milestone.model_dump_json())["target_date"] == "2024-06-30"
+    assert {"type": "string", "format": "date-time"} in Requirement.model_json_schema()["properties"]["last_updated"]["anyOf"]
+    assert {"type": "string", "format": "date"} in Milestone.model_json_schema()["properties"]["target_date"]["anyOf"]
+
+
+def test_from_trusted_rebuilds_validated_records():
+    issue = Issue(id="i1", title="Crash on save", type="Bug", severity="High", created_date="2024-01-01T09:30:00")
+    requirement = Requirement(id="r1", acceptance_criteria=["works"], last_updated="2024-03-01")
+
+    assert Issue.from_trusted(**issue.__dict__) == issue
+    assert Requirement.from_trusted(**requirement.__dict__) == requirement
+    assert Issue.from_trusted(id="i2", title="Add export") == Issue(id="i2", title="Add export")
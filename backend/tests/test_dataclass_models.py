@@ -0,0 +1,49 @@
+from dataclasses import fields, replace
+
+import pytest
+from pydantic import ValidationError
+
+from models.data_models import Issue, Project
+from models.dataclass_models import dataclass_for, from_dataclass, to_dataclass
+
+
+@pytest.fixture
+def issue():
+    return Issue(id="i1", title="Crash on save", type="Bug", severity="High",
+                 estimate_hours=2.5, created_date="2024-01-01T09:30:00")
+
+
+def test_dataclass_for_mirrors_model_fields():
+    record_type = dataclass_for(Issue)
+
+    assert record_type is dataclass_for(Issue)
+    assert record_type.__name__ == "IssueRecord"
+    assert hasattr(record_type, "__slots__")
+    assert [f.name for f in fields(record_type)][:2] == ["id", "title"]
+    assert {f.name for f in fields(record_type)} == set(Issue.model_fields)
+    assert record_type(id="i2", title="Add export").severity is None
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_dataclass_round_trip(issue, validate):
+    record = to_dataclass(issue)
+
+    assert type(record) is dataclass_for(Issue)
+    assert record.severity == "High"
+    assert from_dataclass(Issue, record, validate=validate) == issue
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_dataclass_round_trip_with_nested_model(validate):
+    project = Project(id="p1", name="Portal", methodology="Scrum", sdlc_phase="Inception",
+                      scope={"epics": ["e1"]}, risks=["budget"])
+
+    assert from_dataclass(Project, to_dataclass(project), validate=validate) == project
+
+
+def test_from_dataclass_validates_by_default(issue):
+    record = replace(to_dataclass(issue), severity="Urgent")
+
+    with pytest.raises(ValidationError):
+        from_dataclass(Issue, record)
+    assert from_dataclass(Issue, record, validate=False).severity == "Urgent"
@@ -0,0 +1,61 @@
+import logging
+import logging.handlers
+
+import pytest
+
+from config import logging_config
+from config.logging_config import setup_logging
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    # setup_logging creates ../logs relative to the working directory
+    workdir = tmp_path / "backend"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    yield tmp_path
+    logging_config._stop_queue_listener()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+def test_setup_logging_twice_writes_through_the_latest_listener(log_dir):
+    first_file, second_file = log_dir / "first.log", log_dir / "second.log"
+
+    setup_logging(log_file=str(first_file))
+    first_listener = logging_config._queue_listener
+    logging.getLogger("test.first").warning("first %s", "record")
+
+    setup_logging(log_file=str(second_file))
+    second_listener = logging_config._queue_listener
+    logging.getLogger("test.second").error("second record", exc_info=ValueError("boom"))
+    logging_config._stop_queue_listener()
+
+    root_handlers = logging.getLogger().handlers
+    assert len(root_handlers) == 1
+    assert isinstance(root_handlers[0], logging.handlers.QueueHandler)
+    assert second_listener is not first_listener
+    assert first_listener._thread is None and second_listener._thread is None
+    assert all(handler.stream is None for handler in first_listener.handlers)
+
+    first_log, second_log = first_file.read_text(), second_file.read_text()
+    assert "first record" in first_log
+    assert "second record" not in first_log
+    assert "second record" in second_log
+    assert "ValueError: boom" in second_log
+    assert (log_dir / "logs").is_dir()
+
+
+def test_setup_logging_filters_below_log_level(log_dir):
+    log_file = log_dir / "app.log"
+
+    setup_logging(log_level="WARNING", log_file=str(log_file))
+    logging.getLogger("test.level").info("hidden")
+    logging.getLogger("test.level").warning("shown")
+    logging_config._stop_queue_listener()
+
+    log = log_file.read_text()
+    assert "shown" in log
+    assert "hidden" not in log
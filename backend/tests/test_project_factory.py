@@ -0,0 +1,50 @@
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from models.data_models import Project
+from models.factory import ProjectFactory
+
+PROJECT = {
+    "id": "p1",
+    "name": "Portal",
+    "methodology": "Scrum",
+    "sdlc_phase": "Inception",
+    "scope": {"epics": ["e1"]},
+    "created_date": "2024-01-01T09:30:00",
+}
+
+
+@pytest.fixture(scope="module")
+def factory():
+    return ProjectFactory()
+
+
+def test_load_project_json(factory):
+    project = factory.load_project_json(orjson.dumps(PROJECT))
+
+    assert project == Project(**PROJECT)
+    assert project.scope.epics == ["e1"]
+    assert factory.load_project_json(orjson.dumps(PROJECT).decode()) == project
+
+
+def test_load_project_json_rejects_invalid_input(factory):
+    with pytest.raises(ValidationError):
+        factory.load_project_json(orjson.dumps({**PROJECT, "methodology": "Chaos"}))
+    with pytest.raises(ValidationError):
+        factory.load_project_json(b'{"id": "p1"')
+
+
+def test_load_projects_json(factory):
+    other = {**PROJECT, "id": "p2", "name": "Billing"}
+    projects = factory.load_projects_json(orjson.dumps([PROJECT, other]))
+
+    assert projects == [Project(**PROJECT), Project(**other)]
+    assert factory.load_projects_json(b"[]") == []
+
+
+def test_load_projects_json_rejects_invalid_input(factory):
+    with pytest.raises(ValidationError):
+        factory.load_projects_json(orjson.dumps([PROJECT, {"id": "p2"}]))
+    with pytest.raises(ValidationError):
+        factory.load_projects_json(orjson.dumps(PROJECT))
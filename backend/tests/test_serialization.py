@@ -0,0 +1,48 @@
+from typing import List
+
+import orjson
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from models.data_models import Issue, Project
+from models.serialization import bulk_validate_json, to_json_bulk
+
+
+@pytest.fixture
+def issues():
+    return [
+        Issue(id="i1", title="Crash on save", type="Bug", severity="High", estimate_hours=1e16,
+              due_date="2024-02-01", created_date="2024-01-01T09:30:00.123456+00:00"),
+        Issue(id="i2", title="Add export", created_date="2024-01-01T09:30:00+02:00"),
+        Issue(id="i3", title="Slow search", created_date="2024-01-01"),
+    ]
+
+
+def test_to_json_bulk_matches_model_serializer(issues):
+    data = orjson.loads(to_json_bulk(issues))
+
+    assert data == orjson.loads(TypeAdapter(List[Issue]).dump_json(issues))
+    assert data == [orjson.loads(issue.model_dump_json()) for issue in issues]
+    assert data[0]["created_date"] == "2024-01-01T09:30:00.123456Z"
+
+
+def test_to_json_bulk_serializes_nested_models():
+    project = Project(id="p1", name="Portal", methodology="Scrum", sdlc_phase="Inception",
+                      scope={"epics": ["e1"], "acceptance_criteria": ["works"]})
+
+    assert orjson.loads(to_json_bulk([project])) == [orjson.loads(project.model_dump_json())]
+
+
+def test_bulk_validate_json_matches_model_validation(issues):
+    raw = TypeAdapter(List[Issue]).dump_json(issues, exclude_none=True)
+    records = bulk_validate_json(Issue, raw)
+
+    assert [Issue(**record) for record in records] == issues
+    assert records[1] == {"id": "i2", "title": "Add export", "created_date": issues[1].created_date}
+
+
+def test_bulk_validate_json_rejects_invalid_records():
+    with pytest.raises(ValidationError):
+        bulk_validate_json(Issue, b'[{"id": "i1", "title": "ok"}, {"id": "i2"}]')
+    with pytest.raises(ValidationError):
+        bulk_validate_json(Issue, b'[{"id": "i1", "title": "ok", "severity": "Urgent"}]')
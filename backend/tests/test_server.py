@@ -7,13 +7,15 @@ def client():
     with TestClient(app) as c:
         yield c
 
+@pytest.fixture(scope="module")
+def session_id(client):
+    return client.post("/api/session").json()["session_id"]
+
 def test_create_session(client):
     response = client.post("/api/session")
     assert response.status_code == 200
     assert "session_id" in response.json()
 
-def test_websocket_connection(client):
-    response = client.post("/api/session")
-    session_id = response.json()["session_id"]
+def test_websocket_connection(client, session_id):
     with client.websocket_connect(f"/ws/{session_id}") as websocket:
         websocket.close()
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+
+import pytest
+
+from server import UserSession, UserSessionManager
+
+
+def drain(pool):
+    sessions = []
+    while not pool.empty():
+        sessions.append(pool.get_nowait())
+    return sessions
+
+
+def refill(pool, sessions):
+    for session in sessions:
+        pool.put_nowait(session)
+
+
+@pytest.fixture
+async def manager():
+    manager = UserSessionManager(model_client=None, tracer_provider=None, pool_size=2)
+    yield manager
+    await manager.close_pool()
+
+
+@pytest.fixture
+def built(monkeypatch):
+    """Record every session whose initialize() was called."""
+    sessions = []
+    initialize = UserSession.initialize
+
+    async def recording_initialize(self):
+        sessions.append(self)
+        await initialize(self)
+
+    monkeypatch.setattr(UserSession, "initialize", recording_initialize)
+    return sessions
+
+
+async def test_pool_hands_out_prebuilt_sessions_and_refills(manager, built):
+    await manager.fill_pool()
+    pooled = drain(manager.pool)
+    refill(manager.pool, pooled)
+    assert len(pooled) == 2
+    assert all(session.started for session in pooled)
+
+    session_id = await manager.create_session()
+    session = manager.get_session(session_id)
+    assert session is pooled[0]
+
+    await manager._refill_task
+    refilled = drain(manager.pool)
+    refill(manager.pool, refilled)
+    assert len(refilled) == 2
+    assert session not in refilled
+
+    await manager.close_pool()
+
+    assert manager.pool.qsize() == 0
+    assert manager.sessions == {}
+    assert len(built) == 3
+    assert not any(s.started for s in built)
+
+
+async def test_schedule_fill_builds_the_pool_in_the_background(manager):
+    manager.schedule_fill()
+    task = manager._refill_task
+    assert manager.pool.qsize() == 0
+
+    manager.schedule_fill()
+    assert manager._refill_task is task
+
+    session_id = await manager.create_session()
+    await task
+    await manager._refill_task
+
+    assert manager.pool.qsize() == 2
+    assert manager.get_session(session_id) not in drain(manager.pool)
+
+
+async def test_close_session_stops_its_runtime(manager):
+    session_id = await manager.create_session()
+    session = manager.get_session(session_id)
+    assert session.started
+
+    await manager.close_session(session_id)
+
+    assert not session.started
+    assert manager.get_session(session_id) is None
+
+
+async def test_close_pool_stops_a_session_being_built(manager, built, monkeypatch):
+    started = asyncio.Event()
+    initialize = UserSession.initialize
+
+    async def slow_initialize(self):
+        await initialize(self)
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(UserSession, "initialize", slow_initialize)
+    manager.schedule_fill()
+    await started.wait()
+
+    await manager.close_pool()
+
+    assert manager._refill_task is None
+    assert manager.pool.qsize() == 0
+    assert len(built) == 1 and not built[0].started
+
+
+async def test_failed_build_stops_its_runtime(manager, built, monkeypatch):
+    initialize = UserSession.initialize
+
+    async def failing_initialize(self):
+        await initialize(self)
+        assert self.started
+        raise RuntimeError("UserLogin could not be published")
+
+    monkeypatch.setattr(UserSession, "initialize", failing_initialize)
+
+    with pytest.raises(RuntimeError):
+        await manager.create_session()
+
+    assert manager.sessions == {}
+    assert len(built) == 1 and not built[0].started
+
+
+async def test_without_pool_sessions_are_built_on_demand():
+    manager = UserSessionManager(model_client=None, tracer_provider=None)
+    session_id = await manager.create_session()
+    session = manager.get_session(session_id)
+
+    manager.schedule_fill()
+    assert manager._refill_task is None
+    assert manager.pool.qsize() == 0
+
+    await manager.close_pool()
+    assert not session.started
+
+
+
+async def test_failed_refill_is_logged_and_shutdown_still_closes_sessions(manager, monkeypatch, caplog):
+    await manager.fill_pool()
+
+    async def failing_initialize(self):
+        raise RuntimeError("agent registration failed")
+
+    monkeypatch.setattr(UserSession, "initialize", failing_initialize)
+    with caplog.at_level(logging.ERROR, logger="server"):
+        session = manager.get_session(await manager.create_session())
+        with pytest.raises(RuntimeError):
+            await manager._refill_task
+        await asyncio.sleep(0)
+
+    assert "Filling the session pool failed" in caplog.text
+    assert "agent registration failed" in caplog.text
+    pooled = drain(manager.pool)
+    refill(manager.pool, pooled)
+    assert len(pooled) == 1
+
+    await manager.close_pool()
+
+    assert manager.sessions == {}
+    assert manager.pool.qsize() == 0
+    assert not session.started and not pooled[0].started